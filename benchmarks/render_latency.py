@@ -0,0 +1,171 @@
+"""Render-latency benchmark of `StaticForm` and `DynamicForm`.
+
+The forms are rendered headlessly through `streamlit.testing.v1.AppTest` for synthetic models of
+varying field count, nesting depth and list length. For every case, the benchmark reports the wall
+time of each rerun, the number of widgets emitted and the size of the session state, and writes the
+results as JSON so that they can be compared across versions:
+
+```bash
+python benchmarks/render_latency.py --output results.json
+python benchmarks/render_latency.py --output new.json --compare results.json
+```
+"""
+
+import argparse
+import json
+import pickle
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import version
+from itertools import product
+from pathlib import Path
+from typing import Any, Literal
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Widget
+
+BENCHMARKS_DIR = Path(__file__).parent
+
+
+def _app(benchmarks_dir: str, form_type: str, n_fields: int, depth: int, list_len: int) -> None:
+    # Runs as a standalone Streamlit script, so everything it needs is imported here
+    import sys  # noqa: PLC0415
+
+    import streamlit as st  # noqa: PLC0415
+
+    from streamlit_pydantic_form import DynamicForm, StaticForm  # noqa: PLC0415
+
+    sys.path.insert(0, benchmarks_dir)
+    from synthetic_models import synthetic_model  # noqa: PLC0415
+
+    model = synthetic_model(n_fields, depth, with_list=list_len > 0)
+    if form_type == "static":
+        with StaticForm("benchmark", model=model) as form:
+            form.input_widgets()
+            st.form_submit_button("Submit")
+    else:
+        DynamicForm("benchmark", model=model).input_widgets()
+
+
+@dataclass
+class Case:
+    form_type: Literal["static", "dynamic"]
+    n_fields: int
+    depth: int
+    list_len: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.form_type}-fields{self.n_fields}-depth{self.depth}-list{self.list_len}"
+
+
+@dataclass
+class Result:
+    case: Case
+    first_run_ms: float
+    rerun_ms: list[float] = field(default_factory=list)
+    median_rerun_ms: float = 0.0
+    n_widgets: int = 0
+    n_session_state_keys: int = 0
+    session_state_bytes: int | None = None
+
+
+def _session_state_bytes(state: dict[str, Any]) -> int | None:
+    try:
+        return len(pickle.dumps(state))
+    except Exception:  # noqa: BLE001  # some widget values cannot be pickled
+        return None
+
+
+def run_case(case: Case, *, n_reruns: int) -> Result:
+    at = AppTest.from_function(
+        _app,
+        kwargs={
+            "benchmarks_dir": str(BENCHMARKS_DIR),
+            "form_type": case.form_type,
+            "n_fields": case.n_fields,
+            "depth": case.depth,
+            "list_len": case.list_len,
+        },
+        default_timeout=600,
+    )
+    start = time.perf_counter()
+    at.run()
+    first_run_ms = (time.perf_counter() - start) * 1000
+    if case.list_len > 0:
+        at.number_input(key="streamlit_pydantic_form:benchmark.items:__n_items_input").set_value(case.list_len)
+        at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    result = Result(case=case, first_run_ms=first_run_ms)
+    for _ in range(n_reruns):
+        start = time.perf_counter()
+        at.run()
+        result.rerun_ms.append((time.perf_counter() - start) * 1000)
+    result.median_rerun_ms = statistics.median(result.rerun_ms)
+    result.n_widgets = sum(isinstance(node, Widget) for block in (at.main, at.sidebar) for node in block)
+    state = at.session_state.to_dict()
+    result.n_session_state_keys = len(state)
+    result.session_state_bytes = _session_state_bytes(state)
+    return result
+
+
+def default_cases() -> list[Case]:
+    cases = [
+        Case(form_type, n_fields, depth, 0)
+        for form_type, n_fields, depth in product(("static", "dynamic"), (10, 50, 200), (0, 2, 5))
+    ]
+    cases += [Case("dynamic", 10, 0, list_len) for list_len in (10, 50, 100)]
+    return cases
+
+
+def compare(results: list[Result], baseline_path: Path) -> None:
+    baseline = {entry["case_name"]: entry for entry in json.loads(baseline_path.read_text())["results"]}
+    print(f"{'case':<40} {'baseline ms':>12} {'current ms':>12} {'ratio':>8}")
+    for result in results:
+        if (entry := baseline.get(result.case.name)) is None:
+            continue
+        ratio = result.median_rerun_ms / entry["median_rerun_ms"]
+        print(f"{result.case.name:<40} {entry['median_rerun_ms']:>12.1f} {result.median_rerun_ms:>12.1f} {ratio:>8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=Path("benchmark-results.json"))
+    parser.add_argument("--reruns", type=int, default=5, help="number of timed reruns per case")
+    parser.add_argument("--compare", type=Path, help="results of a previous run to compare against")
+    parser.add_argument("--filter", default="", help="only run the cases whose name contains this string")
+    args = parser.parse_args()
+
+    results = []
+    for case in default_cases():
+        if args.filter not in case.name:
+            continue
+        result = run_case(case, n_reruns=args.reruns)
+        print(
+            f"{case.name:<40} first {result.first_run_ms:8.1f} ms  rerun {result.median_rerun_ms:8.1f} ms  "
+            f"{result.n_widgets:5d} widgets  {result.n_session_state_keys:5d} keys",
+        )
+        results.append(result)
+
+    args.output.write_text(
+        json.dumps(
+            {
+                "streamlit_pydantic_form": version("streamlit-pydantic-form"),
+                "streamlit": version("streamlit"),
+                "pydantic": version("pydantic"),
+                "python": platform.python_version(),
+                "results": [{"case_name": result.case.name, **asdict(result)} for result in results],
+            },
+            indent=2,
+        ),
+    )
+    if args.compare is not None:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Synthetic Pydantic models used by the render-latency benchmark."""
+
+from datetime import date
+from functools import cache
+from typing import Any, Literal
+
+from pydantic import BaseModel, create_model
+
+# Leaf field types, cycled over so that every default widget resolver is exercised
+_LEAF_FIELDS: list[tuple[Any, Any]] = [
+    (int, 0),
+    (float, 0.0),
+    (str, ""),
+    (bool, False),
+    (date, date(2000, 1, 1)),
+    (Literal["a", "b", "c"], "a"),
+]
+
+
+def _leaf_fields(n_fields: int) -> dict[str, Any]:
+    return {f"f{idx}": _LEAF_FIELDS[idx % len(_LEAF_FIELDS)] for idx in range(n_fields)}
+
+
+@cache
+def synthetic_model(n_fields: int, depth: int, *, with_list: bool) -> type[BaseModel]:
+    """Return a model with `n_fields` leaf fields per level, nested `depth` levels deep.
+
+    If `with_list` is true, the root model also has an `items: list[Item]` field, where `Item` has
+    `n_fields` leaf fields. Models are cached so that every rerun of the benchmark app sees the same
+    classes, as an application importing its models from a module would.
+    """
+    model = create_model(f"Level{depth}", **_leaf_fields(n_fields))
+    for level in range(depth - 1, -1, -1):
+        model = create_model(f"Level{level}", child=(model, ...), **_leaf_fields(n_fields))
+    if with_list:
+        item = create_model("Item", **_leaf_fields(n_fields))
+        model = create_model("Root", __base__=model, items=(list[item], ...))
+    return model
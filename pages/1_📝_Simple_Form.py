@@ -15,6 +15,6 @@ class SimpleFormModel(BaseModel):
 
 with StaticForm("simple_static_form", model=SimpleFormModel) as simple_form:
     val = simple_form.input_widgets()
-    submitted = st.form_submit_button("Submit")
+    submitted = simple_form.form_submit_button("Submit")
     if submitted:
         st.write("slider", val.slider_val, "checkbox", val.checkbox_val)
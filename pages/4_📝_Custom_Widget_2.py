@@ -38,6 +38,6 @@ class PointFormModel(BaseModel):
 
 with StaticForm("custom_widget_form_2", model=PointFormModel) as point_form2:
     val4 = point_form2.input_widgets()
-    submitted = st.form_submit_button("Submit")
+    submitted = point_form2.form_submit_button("Submit")
     if submitted:
         st.write("x", val4.p.x, "y", val4.p.y)
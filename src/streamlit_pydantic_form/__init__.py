@@ -1,8 +1,41 @@
 __all__ = [
+    "BatchForm",
+    "DraftStore",
     "DynamicForm",
+    "FieldChange",
+    "FormGroup",
+    "FormProfile",
+    "Instrumentation",
+    "JsonlSink",
     "NoWidgetBuilderFoundError",
     "NotYetSubmittedError",
+    "OptionProvider",
+    "ParquetSink",
+    "SpooledUpload",
     "StaticForm",
+    "SubmissionSink",
+    "SubmissionSinkFullError",
+    "WidgetKeyCollisionError",
+    "changeset",
+    "enable_validation_cache",
+    "model_from_json_schema",
+    "register_widget_resolver",
 ]
-from ._exceptions import NotYetSubmittedError, NoWidgetBuilderFoundError
+from ._batch import BatchForm
+from ._changeset import FieldChange, changeset
+from ._drafts import DraftStore
+from ._exceptions import (
+    NotYetSubmittedError,
+    NoWidgetBuilderFoundError,
+    SubmissionSinkFullError,
+    WidgetKeyCollisionError,
+)
+from ._files import SpooledUpload
 from ._form import DynamicForm, StaticForm
+from ._group import FormGroup
+from ._instrumentation import FormProfile, Instrumentation
+from ._options import OptionProvider
+from ._resolver import register_widget_resolver
+from ._schema import model_from_json_schema
+from ._sinks import JsonlSink, ParquetSink, SubmissionSink
+from ._validation import enable_validation_cache
@@ -0,0 +1,82 @@
+__all__ = [
+    "BatchForm",
+]
+from types import TracebackType
+from typing import Any, Generic, Self, TypeVar
+
+import streamlit as st
+from pydantic import BaseModel
+
+from ._form import SESSION_STATE_KEY_PREFIX
+from ._store import FormStore
+from .widget import Table
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class BatchForm(Generic[T]):
+    """A form to enter a batch of records of a flat model, one per row of a table.
+
+    The rows are edited in the browser without rerunning the script, and the whole batch is validated
+    in a single `TypeAdapter(list[Model])` pass when it is submitted. Validation errors are reported by
+    row and column. The keyword arguments are passed to `st.data_editor`.
+
+    Example:
+    -------
+    ```python
+    with BatchForm("records", model=RecordModel) as form:
+        records = form.input_widgets()
+        if form.form_submit_button("Submit"):
+            save(records)
+            form.clear()
+    ```
+
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        model: type[T],
+        border: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        self.model = model
+        self.key = key
+        self.form = st.form(key=self.key, border=border)
+        self.table = Table(**kwargs).bind(list[model])  # ty: ignore[invalid-type-form]
+        self._valid = False
+
+    @property
+    def _session_state_base_key(self) -> str:
+        return f"{SESSION_STATE_KEY_PREFIX}:{self.key}"
+
+    def clear(self) -> None:
+        """Reset the batch, removing its rows from session state."""
+        FormStore.of(self._session_state_base_key).clear()
+
+    def input_widgets(self) -> list[T]:
+        """Render the table and return the validated records, or an empty list if some rows are invalid."""
+        key = f"{self._session_state_base_key}.records"
+        records = self.table.build(self.form, kwargs={"key": key})
+        # Invalid rows have their errors shown below the table
+        self._valid = f"{key}:__errors" not in st.session_state
+        return records if self._valid else []
+
+    def form_submit_button(self, *args: Any, **kwargs: Any) -> bool:
+        """Display a form submit button, which returns `True` only if the submitted batch is valid."""
+        return self.form.form_submit_button(*args, **kwargs) and self._valid
+
+    def __enter__(self) -> Self:
+        # Enter the inner st.form
+        self.form.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # Exit the inner st.form
+        self.form.__exit__(exc_type, exc_value, traceback)
@@ -0,0 +1,73 @@
+__all__ = [
+    "FieldChange",
+    "changeset",
+]
+from dataclasses import dataclass
+from enum import Enum
+from itertools import zip_longest
+from typing import Any
+
+from pydantic import BaseModel
+
+from ._plan import compile_form_plan
+
+
+@dataclass(frozen=True, slots=True)
+class FieldChange:
+    """A leaf field whose value changed, at a path such as `address.city` or `items[0].name`."""
+
+    path: str
+    old: Any
+    new: Any
+
+
+def changeset(old: BaseModel | None, new: BaseModel) -> list[FieldChange]:
+    """Return the leaf fields of `new` whose value differs from `old`, in declaration order.
+
+    Nested models and list items are compared field by field, and skipped when they are the same instance,
+    as unchanged subtrees of a form are. Models are compared by their fields rather than by class, as a model
+    defined in the page script is a new class on every rerun. A nested model replaced by one with other fields
+    (e.g. another union variant) or by `None`, and removed list items, are reported as a whole; new ones are
+    reported leaf by leaf.
+    If `old` is `None`, every leaf field of `new` that is not `None` is reported.
+    """
+    changes: list[FieldChange] = []
+    _diff(old, new, "", changes)
+    return changes
+
+
+def _diff(old: BaseModel | None, new: BaseModel, prefix: str, changes: list[FieldChange]) -> None:
+    for node in compile_form_plan(type(new)).nodes:
+        old_value, new_value = getattr(old, node.name, None), getattr(new, node.name)
+        if old_value is new_value:
+            continue
+        path = prefix + node.name
+        if node.kind == "list":
+            for idx, (old_item, new_item) in enumerate(zip_longest(old_value or (), new_value)):
+                _diff_value(old_item, new_item, f"{path}[{idx}]", changes)
+        else:
+            _diff_value(old_value, new_value, path, changes)
+
+
+def _diff_value(old: Any, new: Any, path: str, changes: list[FieldChange]) -> None:
+    if old is new:
+        return
+    if isinstance(new, BaseModel) and (old is None or _same_fields(old, new)):
+        _diff(old, new, f"{path}.", changes)
+    elif not _equal(old, new):
+        changes.append(FieldChange(path, old, new))
+
+
+def _same_fields(old: Any, new: BaseModel) -> bool:
+    return isinstance(old, BaseModel) and type(old).model_fields.keys() == type(new).model_fields.keys()
+
+
+def _equal(old: Any, new: Any) -> bool:
+    """Compare leaf values, matching models and enums by their values rather than by class."""
+    if isinstance(new, BaseModel):
+        return _same_fields(old, new) and all(_equal(getattr(old, name), value) for name, value in new)
+    if isinstance(new, Enum):
+        return isinstance(old, Enum) and type(old).__qualname__ == type(new).__qualname__ and old.value == new.value
+    if isinstance(new, list | tuple) and isinstance(old, list | tuple):
+        return len(old) == len(new) and all(map(_equal, old, new))
+    return type(old) is type(new) and old == new
@@ -0,0 +1,145 @@
+__all__ = [
+    "DraftStore",
+]
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from pathlib import Path
+from time import monotonic
+from time import time as now
+from typing import Any
+
+_logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    form_key TEXT NOT NULL,
+    draft_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (form_key, draft_id)
+)
+"""
+
+_TEMPORAL_TYPES: dict[str, type[date | time]] = {"datetime": datetime, "date": date, "time": time}
+
+
+def _encode(value: Any) -> Any:
+    for tag, cls in _TEMPORAL_TYPES.items():
+        if isinstance(value, cls):
+            return {"__type__": tag, "value": value.isoformat()}
+    msg = f"Cannot store a value of type {type(value).__name__} in a draft"
+    raise TypeError(msg)
+
+
+def _decode(obj: dict[str, Any]) -> Any:
+    if (cls := _TEMPORAL_TYPES.get(obj.get("__type__", ""))) is not None:
+        return cls.fromisoformat(obj["value"])
+    return obj
+
+
+class DraftStore:
+    """Drafts of forms' raw input values, saved to a local SQLite database.
+
+    Saving only queues the draft: a background thread writes the queued drafts in a single transaction
+    once no draft has been queued for `debounce` seconds (or at the latest after `5 * debounce` seconds),
+    so reruns never wait for the disk.
+    Drafts not updated for `ttl` seconds are expired.
+    Create a single store per database, e.g. with `st.cache_resource`.
+
+    Example:
+    -------
+    ```python
+    @st.cache_resource
+    def draft_store() -> DraftStore:
+        return DraftStore("drafts.sqlite3")
+
+
+    form = DynamicForm("form", model=MyModel, draft_store=draft_store(), draft_id=user_id)
+    ```
+
+    """
+
+    def __init__(self, path: str | Path, *, debounce: float = 2.0, ttl: float = 7 * 24 * 3600) -> None:
+        self.path = Path(path)
+        self.debounce = debounce
+        self.ttl = ttl
+        self._pending: dict[tuple[str, str], str | None] = {}
+        self._lock = threading.Lock()
+        self._queued = threading.Event()
+        with self._connect() as connection:
+            connection.execute(_SCHEMA)
+        threading.Thread(target=self._write_loop, name="streamlit_pydantic_form_drafts", daemon=True).start()
+        atexit.register(self.flush)
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:  # commit, or roll back on error
+                yield connection
+        finally:
+            connection.close()
+
+    def save(self, form_key: str, draft_id: str, state: dict[str, Any]) -> None:
+        """Queue the draft of a form to be written."""
+        data = json.dumps(state, default=_encode)
+        with self._lock:
+            self._pending[form_key, draft_id] = data
+        self._queued.set()
+
+    def delete(self, form_key: str, draft_id: str) -> None:
+        """Queue the draft of a form to be deleted."""
+        with self._lock:
+            self._pending[form_key, draft_id] = None
+        self._queued.set()
+
+    def load(self, form_key: str, draft_id: str) -> dict[str, Any] | None:
+        """Return the draft of a form, or `None` if there is none or it has expired."""
+        with self._lock:
+            if (form_key, draft_id) in self._pending:
+                data = self._pending[form_key, draft_id]
+                return None if data is None else json.loads(data, object_hook=_decode)
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT state FROM drafts WHERE form_key = ? AND draft_id = ? AND updated_at >= ?",
+                (form_key, draft_id, now() - self.ttl),
+            ).fetchone()
+        return None if row is None else json.loads(row[0], object_hook=_decode)
+
+    def flush(self) -> None:
+        """Write the queued drafts now."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        timestamp = now()
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO drafts VALUES (?, ?, ?, ?)",
+                [(*key, data, timestamp) for key, data in pending.items() if data is not None],
+            )
+            connection.executemany(
+                "DELETE FROM drafts WHERE form_key = ? AND draft_id = ?",
+                [key for key, data in pending.items() if data is None],
+            )
+            connection.execute("DELETE FROM drafts WHERE updated_at < ?", (timestamp - self.ttl,))
+
+    def _write_loop(self) -> None:
+        while True:
+            self._queued.wait()
+            # Wait until no draft has been queued for `debounce` seconds, coalescing the saves in between
+            deadline = monotonic() + 5 * self.debounce
+            while monotonic() < deadline:
+                self._queued.clear()
+                if not self._queued.wait(self.debounce):
+                    break
+            try:
+                self.flush()
+            except sqlite3.Error:
+                _logger.exception("Failed to write form drafts to %s", self.path)
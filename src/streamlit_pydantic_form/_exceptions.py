@@ -2,6 +2,8 @@ __all__ = [
     "NoWidgetBuilderFoundError",
     "NotYetSubmittedError",
     "StreamlitPydanticFormError",
+    "SubmissionSinkFullError",
+    "WidgetKeyCollisionError",
 ]
 
 
@@ -17,7 +19,24 @@ class NotYetSubmittedError(StreamlitPydanticFormError):
 
 
 class NoWidgetBuilderFoundError(StreamlitPydanticFormError):
-    """Raised when no widget builder is found in the metadata."""
+    """Raised when no widget builder is found in the metadata nor resolved from the annotation."""
 
     def __init__(self) -> None:
-        super().__init__("No widget builder found in metadata")
+        super().__init__("No widget builder found in metadata nor registered for the annotation")
+
+
+class WidgetKeyCollisionError(StreamlitPydanticFormError):
+    """Raised when widget builders rendered in the same run are given the same derived key."""
+
+    def __init__(self, key: str, builder: str) -> None:
+        super().__init__(
+            f"Two `{builder}` widget builders rendered in the same run were given the same key `{key}`; "
+            "give them distinct labels or keys",
+        )
+
+
+class SubmissionSinkFullError(StreamlitPydanticFormError):
+    """Raised when a submitted value cannot be queued because the sink's writer is falling behind."""
+
+    def __init__(self) -> None:
+        super().__init__("Too many submissions are waiting to be saved, please try again later")
@@ -0,0 +1,86 @@
+__all__ = [
+    "SpooledUpload",
+    "spool_upload",
+]
+import hashlib
+from collections.abc import Collection
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, BinaryIO
+from weakref import finalize
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+
+
+class SpooledUpload:
+    """Handle to an uploaded file spooled to a temporary file, given to the model instead of the file's bytes.
+
+    The temporary file is deleted once the handle is no longer referenced.
+    """
+
+    __slots__ = ("__weakref__", "content_type", "file_id", "name", "path", "sha256", "size")
+
+    def __init__(self, *, file_id: str, name: str, path: Path, size: int, sha256: str, content_type: str) -> None:
+        self.file_id = file_id
+        self.name = name
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+        self.content_type = content_type
+        finalize(self, path.unlink, missing_ok=True)
+
+    def open(self) -> BinaryIO:
+        """Open the spooled file for reading."""
+        return self.path.open("rb")
+
+    def __repr__(self) -> str:
+        return f"SpooledUpload(name={self.name!r}, size={self.size}, sha256={self.sha256[:12]!r}...)"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # Validated by identity, so that the model holds the very handle owning the temporary file
+        return core_schema.is_instance_schema(cls)
+
+
+def spool_upload(
+    uploaded: UploadedFile,
+    *,
+    chunk_size: int,
+    max_size: int | None = None,
+    content_types: Collection[str] | None = None,
+) -> SpooledUpload:
+    """Copy an uploaded file to a temporary file in chunks, hashing it on the way.
+
+    Raises `ValueError` if the file is larger than `max_size` bytes or its content type is not allowed.
+    """
+    if content_types is not None and uploaded.type not in content_types:
+        msg = f"`{uploaded.name}` has content type `{uploaded.type}`, expected one of {', '.join(content_types)}"
+        raise ValueError(msg)
+    if max_size is not None and uploaded.size > max_size:
+        msg = f"`{uploaded.name}` is larger than {max_size} bytes"
+        raise ValueError(msg)
+
+    digest = hashlib.sha256()
+    with NamedTemporaryFile(prefix="streamlit_pydantic_form_", delete=False) as spooled:
+        try:
+            # Slices of the upload's buffer are views, so no copy of the file is made in memory
+            with uploaded.getbuffer() as buffer:
+                for offset in range(0, len(buffer), chunk_size):
+                    chunk = buffer[offset : offset + chunk_size]
+                    digest.update(chunk)
+                    spooled.write(chunk)
+        except BaseException:
+            spooled.close()
+            Path(spooled.name).unlink(missing_ok=True)
+            raise
+
+    return SpooledUpload(
+        file_id=uploaded.file_id,
+        name=uploaded.name,
+        path=Path(spooled.name),
+        size=uploaded.size,
+        sha256=digest.hexdigest(),
+        content_type=uploaded.type,
+    )
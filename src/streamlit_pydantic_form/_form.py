@@ -2,12 +2,15 @@ __all__ = [
     "DynamicForm",
     "StaticForm",
 ]
+import re
 import warnings
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Mapping, Sequence
 from contextlib import contextmanager
-from inspect import isclass
-from types import GenericAlias, TracebackType
-from typing import Any, Generic, Self, TypeVar, get_args, get_origin
+from datetime import date, time
+from functools import partial
+from time import perf_counter
+from types import TracebackType
+from typing import Any, Generic, Self, TypeVar
 
 import streamlit as st
 from pydantic import BaseModel
@@ -15,7 +18,16 @@ from pydantic_core import PydanticUndefined
 from streamlit.delta_generator import DeltaGenerator
 from typing_extensions import deprecated
 
-from ._exceptions import NotYetSubmittedError, NoWidgetBuilderFoundError
+from ._changeset import FieldChange, changeset
+from ._drafts import DraftStore
+from ._exceptions import NotYetSubmittedError, SubmissionSinkFullError
+from ._instrumentation import Instrumentation
+from ._plan import FieldNode, compile_form_plan, is_recursive
+from ._schema import model_from_json_schema
+from ._sinks import SubmissionSink
+from ._store import FormStore
+from ._submit import SubmitValidator, run_submit_validators
+from ._validation import validate
 from .widget import WidgetBuilder
 
 T = TypeVar("T", bound=BaseModel)
@@ -32,20 +44,55 @@ class StaticForm(Generic[T]):
         clear_on_submit: bool = False,
         border: bool = True,
         widget_builder: WidgetBuilder[T] | None = None,
+        instrumentation: Instrumentation | None = None,
+        submit_validators: Mapping[str, SubmitValidator] | None = None,
+        submit_timeout: float = 10.0,
+        sink: SubmissionSink | None = None,
+        max_depth: int | None = None,
+        initial_value: T | None = None,
     ) -> None:
         self.model = model
         self.key = key
         self.form = st.form(key=self.key, clear_on_submit=clear_on_submit, border=border)
         self.widget_builder = widget_builder
+        self.instrumentation = instrumentation
+        self.submit_validators = submit_validators
+        self.submit_timeout = submit_timeout
+        self.sink = sink
+        self.max_depth = max_depth
+        self.initial_value = initial_value
+        self._value: T | None = None
+
+    @classmethod
+    def from_json_schema(cls, key: str, schema: dict[str, Any], **kwargs: Any) -> "StaticForm[Any]":
+        """Create a form for the model defined by a JSON Schema object, see `model_from_json_schema`."""
+        return cls(key, model=model_from_json_schema(schema), **kwargs)  # ty: ignore[invalid-argument-type]
 
     @property
     def _session_state_base_key(self) -> str:
         return f"{SESSION_STATE_KEY_PREFIX}:{self.key}"
 
+    def clear(self) -> None:
+        """Reset the form's inputs, removing their values from session state."""
+        FormStore.of(self._session_state_base_key).clear()
+
+    def dispose(self) -> None:
+        """Remove everything the form keeps in session state."""
+        FormStore.of(self._session_state_base_key).dispose()
+
     def input_widgets(self) -> T:
         if self.widget_builder is not None:
-            return self.widget_builder.build(self.form)
-        return model_to_input_components(self.model, form=self.form, base_key=self._session_state_base_key)
+            self._value = self.widget_builder.build(self.form)
+        else:
+            self._value = model_to_input_components(
+                self.model,
+                form=self.form,
+                value=self.initial_value,
+                base_key=self._session_state_base_key,
+                instrumentation=self.instrumentation,
+                max_depth=self.max_depth,
+            )
+        return self._value
 
     @deprecated(
         "st_auto_form.input_components() is deprecated, use st_auto_form.input_widgets() instead",
@@ -58,9 +105,28 @@ class StaticForm(Generic[T]):
         )
         return self.input_widgets()
 
+    def form_submit_button(self, *args: Any, **kwargs: Any) -> bool:
+        """Display a form submit button, taking the arguments of `st.form_submit_button`.
+
+        If the form has submit validators, they are run when the button is clicked. If any of them fails,
+        the script is rerun to show the errors next to the fields, so the button only returns `True` once they pass.
+        The submitted value is then queued to the form's sink, if any, and its `changeset` is computed.
+        """
+        submitted = self.form.form_submit_button(*args, **kwargs)
+        if submitted and self._value is not None:
+            store = FormStore.of(self._session_state_base_key)
+            if not _accept_submission(self._value, store, self.submit_validators, self.submit_timeout, self.sink):
+                st.rerun()
+            _record_submission(store, self._value, self.initial_value)
+        return submitted
+
     @property
-    def form_submit_button(self) -> Callable[..., bool]:
-        return self.form.form_submit_button
+    def changeset(self) -> list[FieldChange]:
+        """The leaf fields changed by the last submission, since the previous one or else since `initial_value`."""
+        store = FormStore.of(self._session_state_base_key)
+        if store.value is None:
+            raise NotYetSubmittedError
+        return store.changes
 
     def __enter__(self) -> Self:
         # Enter the inner st.form
@@ -87,26 +153,56 @@ class DynamicForm(Generic[T]):
         model: type[T],
         border: bool = True,
         widget_builder: WidgetBuilder[T] | None = None,
+        list_page_size: int | None = None,
+        instrumentation: Instrumentation | None = None,
+        subtree_fragments: bool = False,
+        collapsed_sections: bool = False,
+        submit_validators: Mapping[str, SubmitValidator] | None = None,
+        submit_timeout: float = 10.0,
+        draft_store: DraftStore | None = None,
+        draft_id: str | None = None,
+        sink: SubmissionSink | None = None,
+        max_depth: int | None = None,
+        initial_value: T | None = None,
     ) -> None:
+        if draft_store is not None and draft_id is None:
+            msg = "A `draft_id` identifying the user is required to save drafts"
+            raise ValueError(msg)
         self.key = key
         self.model = model
         self.border = border
         self.widget_builder = widget_builder
-
-    @property
-    def _session_state_key_submitted(self) -> str:
-        """Key to store the submitted state of the form."""
-        return f"{SESSION_STATE_KEY_PREFIX}:{self.key}:submitted"
+        self.list_page_size = list_page_size
+        self.instrumentation = instrumentation
+        self.subtree_fragments = subtree_fragments
+        self.collapsed_sections = collapsed_sections
+        self.submit_validators = submit_validators
+        self.submit_timeout = submit_timeout
+        self.draft_store = draft_store
+        self.draft_id = draft_id
+        self.sink = sink
+        self.max_depth = max_depth
+        self.initial_value = initial_value
+
+    @classmethod
+    def from_json_schema(cls, key: str, schema: dict[str, Any], **kwargs: Any) -> "DynamicForm[Any]":
+        """Create a form for the model defined by a JSON Schema object, see `model_from_json_schema`."""
+        return cls(key, model=model_from_json_schema(schema), **kwargs)  # ty: ignore[invalid-argument-type]
 
     @property
     def _session_state_base_key(self) -> str:
         """Base key to store the form's input values."""
         return f"{SESSION_STATE_KEY_PREFIX}:{self.key}"
 
+    @property
+    def _store(self) -> FormStore:
+        """The form's state other than its widget values."""
+        return FormStore.of(self._session_state_base_key)
+
     @property
     def submitted(self) -> bool:
         """Whether the form has been submitted."""
-        return st.session_state.get(self._session_state_key_submitted, False)
+        return self._store.submitted
 
     @property
     def value(self) -> T:
@@ -114,7 +210,62 @@ class DynamicForm(Generic[T]):
         if not self.submitted:
             raise NotYetSubmittedError
 
-        return restore_object_from_session_state(self._session_state_base_key, self.model)
+        store = self._store
+        if store.value is not None and store.value[0] == store.generation:
+            return store.value[1]
+
+        value = restore_object_from_session_state(
+            self._session_state_base_key,
+            self.model,
+            store=store,
+            instrumentation=self.instrumentation,
+        )
+        store.value = (store.generation, value)
+        return value
+
+    @property
+    def changeset(self) -> list[FieldChange]:
+        """The leaf fields changed by the last submission, since the previous one or else since `initial_value`."""
+        if not self.submitted:
+            raise NotYetSubmittedError
+        return self._store.changes
+
+    def clear(self) -> None:
+        """Reset the form's inputs, removing their values from session state and deleting its draft."""
+        self._store.clear()
+        self._delete_draft()
+
+    def dispose(self) -> None:
+        """Remove everything the form keeps in session state, and delete its draft."""
+        self._store.dispose()
+        self._delete_draft()
+
+    def _restore_draft(self, store: FormStore) -> None:
+        """Restore the form's draft into session state, once per session."""
+        if self.draft_store is None or self.draft_id is None or store.draft_restored:
+            return
+        store.draft_restored = True
+        if (draft := self.draft_store.load(self.key, self.draft_id)) is None:
+            return
+        prefix = f"{self._session_state_base_key}."
+        # Drafts saved by earlier versions may hold the state of uploaders, which cannot be set
+        draft = {key: value for key, value in draft.items() if _is_assignable(self.model, key.removeprefix(prefix))}
+        for key, widget_value in draft.items():
+            st.session_state[key] = widget_value
+        store.draft = draft
+
+    def _save_draft(self, store: FormStore) -> None:
+        """Queue the form's draft to be saved if its inputs have changed."""
+        if self.draft_store is None or self.draft_id is None:
+            return
+        draft = _draft_state(self._session_state_base_key, self.model)
+        if draft != store.draft:
+            store.draft = draft
+            self.draft_store.save(self.key, self.draft_id, draft)
+
+    def _delete_draft(self) -> None:
+        if self.draft_store is not None and self.draft_id is not None:
+            self.draft_store.delete(self.key, self.draft_id)
 
     @contextmanager
     def on_submit(self) -> Generator[None, None, None]:
@@ -139,7 +290,7 @@ class DynamicForm(Generic[T]):
             try:
                 yield
             finally:
-                st.session_state[self._session_state_key_submitted] = False
+                self._store.submitted = False
         else:
             raise NotYetSubmittedError
 
@@ -149,45 +300,244 @@ class DynamicForm(Generic[T]):
 
     @st.fragment
     def _form_fragment(self) -> T:
+        store = self._store
+        self._restore_draft(store)
         with st.container(border=self.border):
             value = model_to_input_components(
                 self.model,
-                value=None,
+                value=self.initial_value,
                 base_key=self._session_state_base_key,
+                list_page_size=self.list_page_size,
+                store=store,
+                instrumentation=self.instrumentation,
+                subtree_fragments=self.subtree_fragments,
+                collapsed_sections=self.collapsed_sections,
+                max_depth=self.max_depth,
             )
             if st.button("Submit"):
-                st.session_state[self._session_state_key_submitted] = True
+                if _accept_submission(value, store, self.submit_validators, self.submit_timeout, self.sink):
+                    # The value rendered in this run already reflects the submitted inputs, so it is cached as is
+                    _record_submission(store, value, self.initial_value)
+                    store.submitted = True
+                    # The submitted inputs are not a draft anymore, unless they are edited again
+                    store.draft = _draft_state(self._session_state_base_key, self.model)
+                    self._delete_draft()
                 st.rerun()
+        self._save_draft(store)
         return value
 
 
-def extract_widget_builder_from_metadata(metadata: list[Any]) -> WidgetBuilder[Any]:
-    try:
-        return next(item for item in metadata if isinstance(item, WidgetBuilder))
-    except StopIteration as e:
-        raise NoWidgetBuilderFoundError from e
+def _accept_submission(
+    value: BaseModel,
+    store: FormStore,
+    submit_validators: Mapping[str, SubmitValidator] | None,
+    submit_timeout: float,
+    sink: SubmissionSink | None,
+) -> bool:
+    """Run the submit validators and queue the value to the sink, storing the errors if either fails.
+
+    A form whose tables have invalid rows is not submitted.
+    """
+    if invalid_tables := _invalid_tables(store):
+        store.errors = dict.fromkeys(invalid_tables, "Correct the invalid rows before submitting")
+        return False
+    store.errors = run_submit_validators(value, submit_validators, submit_timeout) if submit_validators else {}
+    if not store.errors and sink is not None:
+        try:
+            sink.submit(value)
+        except SubmissionSinkFullError as e:
+            store.errors = {"": str(e)}
+    return not store.errors
+
+
+_DRAFT_VALUE_TYPES = (bool, int, float, str, date, time)
+
+
+def _invalid_tables(store: FormStore) -> list[str]:
+    """Return the field paths of the form's tables whose rows are invalid."""
+    prefix = f"{store.base_key}."
+    return [
+        _field_path(key.removesuffix(":__errors"), store)
+        for key in st.session_state
+        if isinstance(key, str) and key.startswith(prefix) and key.endswith(":__errors")
+    ]
+
+
+def _record_submission(store: FormStore, value: BaseModel, initial_value: BaseModel | None) -> None:
+    """Cache a submitted value, with its changes since the previous submission or else the initial value."""
+    store.changes = changeset(store.value[1] if store.value is not None else initial_value, value)
+    store.generation += 1
+    store.value = (store.generation, value)
+
+
+def _is_draft_value(value: Any) -> bool:
+    if isinstance(value, list | tuple):
+        return all(map(_is_draft_value, value))
+    return value is None or isinstance(value, _DRAFT_VALUE_TYPES)
+
+
+def _draft_state(base_key: str, model: type[BaseModel]) -> dict[str, Any]:
+    """Return the widget values of a form that can be saved in a draft and set back through session state.
+
+    Uploaded files, camera pictures and table edits are left out.
+    """
+    prefix = f"{base_key}."
+    return {
+        key: value
+        for key, value in st.session_state.items()
+        if isinstance(key, str)
+        and key.startswith(prefix)
+        and _is_draft_value(value)
+        and _is_assignable(model, key.removeprefix(prefix))
+    }
+
+
+# Suffixes of the keys of the widgets that keep the state of a field's builder, which cannot be set
+_READ_ONLY_SUFFIXES = frozenset({"__uploader", "__editor"})
+_PATH_SEGMENT = re.compile(r"\.?([^.\[\]]+)|\[(\d+)\]")
+
+
+def _is_assignable(model: type[BaseModel], path: str) -> bool:
+    """Return whether the widget value at `path` of a form of `model` (e.g. `items[0].name`) can be set.
+
+    Paths that do not match the model's plan are not.
+    """
+    path, _, suffix = path.partition(":")
+    if suffix in _READ_ONLY_SUFFIXES:
+        return False
+    node: FieldNode | None = None
+    current: type[BaseModel] | None = model
+    for name, idx in _PATH_SEGMENT.findall(path):
+        if idx:
+            current = node.model if node is not None and node.kind == "list" else None
+        elif node is not None and node.kind == "union":
+            current = next((variant for tag, variant in node.variants if str(tag) == name), None)
+        elif current is not None:
+            node = next((node for node in compile_form_plan(current).nodes if node.name == name), None)
+            if node is None:
+                return False
+            current = node.model if node.kind == "model" else None
+            continue
+        else:
+            return False
+        if current is None:
+            return False
+        node = None
+    return node is None or node.builder is None or node.builder.value_assignable
 
 
-def restore_object_from_session_state(base_key: str, model: type[T]) -> T:
+def restore_object_from_session_state(
+    base_key: str,
+    model: type[T],
+    *,
+    store: FormStore | None = None,
+    instrumentation: Instrumentation | None = None,
+) -> T:
+    store = store if store is not None else FormStore.of(base_key)
     raw_input_values = {}
 
-    for name, field in model.model_fields.items():
+    for node in compile_form_plan(model).nodes:
+        key = base_key + node.key_suffix
+        # a field nested deeper than the maximum depth keeps its initial value
+        if store.depth_limited and key in store.depth_limited:
+            if (initial := store.depth_limited[key]) is not PydanticUndefined:
+                raw_input_values[node.name] = initial
         # if the field is another model, recursively restore it
-        if isclass(field.annotation) and issubclass(field.annotation, BaseModel):
-            raw_input_values[name] = restore_object_from_session_state(f"{base_key}.{name}", field.annotation)
+        elif node.kind == "model":
+            raw_input_values[node.name] = _restore_section(node, key, store, instrumentation)
         # if the field is a list of models, recursively restore each item
-        elif isinstance(field.annotation, GenericAlias) and get_origin(field.annotation) is list:
-            raw_input_values[name] = [
-                restore_object_from_session_state(f"{base_key}.{name}[{idx}]", get_args(field.annotation)[0])
-                for idx in range(st.session_state[f"{base_key}.{name}:__n_items"])
+        elif node.kind == "list":
+            raw_input_values[node.name] = [
+                restore_object_from_session_state(
+                    f"{key}[{idx}]",
+                    node.plan.model,
+                    store=store,
+                    instrumentation=instrumentation,
+                )
+                for idx in range(store.n_items[key])
             ]
+        # if the field is a discriminated union, restore the selected variant only
+        elif node.kind == "union":
+            tag = st.session_state[f"{key}:__variant"]
+            raw_input_values[node.name] = restore_object_from_session_state(
+                f"{key}.{tag}",
+                dict(node.variants)[tag],
+                store=store,
+                instrumentation=instrumentation,
+            )
+        elif node.kind == "const":
+            raw_input_values[node.name] = node.default
         else:
-            raw_input_values[name] = st.session_state[f"{base_key}.{name}"]
+            raw_input_values[node.name] = st.session_state[key]
 
-    return model(**raw_input_values)
+    return _validate_subtree(model, base_key, raw_input_values, store, instrumentation)
+
+
+def _restore_section(
+    node: FieldNode,
+    key: str,
+    store: FormStore,
+    instrumentation: Instrumentation | None,
+) -> Any:
+    expanded = st.session_state.get(f"{key}:__expanded")
+    if node.optional and not expanded:
+        return None
+    try:
+        return restore_object_from_session_state(key, node.plan.model, store=store, instrumentation=instrumentation)
+    except KeyError:
+        # a collapsed section that has never been expanded keeps its default
+        if expanded is not False:
+            raise
+        return node.initial_value(None)
 
 
-SUPPORTED_GENERIC_ALIAS = {list}
+def _same_input(a: Any, b: Any) -> bool:
+    # Nested models are compared by identity: an unchanged subtree reuses its previous instance
+    if isinstance(a, BaseModel) or isinstance(b, BaseModel):
+        return a is b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(_same_input, a, b))
+    return type(a) is type(b) and a == b
+
+
+def _field_path(key: str, store: FormStore) -> str:
+    return key.removeprefix(store.base_key).removeprefix(".")
+
+
+def _validate_subtree(
+    model: type[T],
+    base_key: str,
+    raw_input_values: dict[str, Any],
+    store: FormStore,
+    instrumentation: Instrumentation | None = None,
+) -> T:
+    """Validate the raw input values of a (nested) model.
+
+    The instance validated on a previous run is reused when the raw input values, including the
+    instances of the nested models, have not changed. Only the edited subtrees and their ancestors
+    are validated again, unless their model's validation cache, shared by all sessions, has a match.
+    A model defined in the page script is a new class on every rerun, so its values are validated again:
+    the previous instance may hold values of other classes defined there too, such as enum members.
+    """
+    cached = store.validated.get(base_key)
+    if (
+        cached is not None
+        and type(cached[1]) is model
+        and cached[0].keys() == raw_input_values.keys()
+        and all(_same_input(cached[0][name], raw_value) for name, raw_value in raw_input_values.items())
+    ):
+        if instrumentation is not None:
+            instrumentation.validation_cache_hit(_field_path(base_key, store))
+        return cached[1]
+
+    start = perf_counter() if instrumentation is not None else 0.0
+    value, shared_hit = validate(model, raw_input_values)
+    if instrumentation is not None and shared_hit:
+        instrumentation.validation_cache_hit(_field_path(base_key, store))
+    elif instrumentation is not None:
+        instrumentation.model_validated(_field_path(base_key, store), perf_counter() - start)
+    store.validated[base_key] = (raw_input_values, value)
+    return value
 
 
 def model_to_input_components(
@@ -196,53 +546,224 @@ def model_to_input_components(
     base_key: str,
     form: DeltaGenerator | None = None,
     value: T | None = None,
+    list_page_size: int | None = None,
+    store: FormStore | None = None,
+    instrumentation: Instrumentation | None = None,
+    subtree_fragments: bool = False,
+    collapsed_sections: bool = False,
+    max_depth: int | None = None,
+    depth: int = 0,
 ) -> T:
+    """Render the input widgets of a model and return its validated value.
+
+    If `subtree_fragments` is true, each nested model and each list item is rendered in its own
+    fragment, so that interacting with its widgets reruns only that section.
+    If `collapsed_sections` is true, each nested model with a prefilled or default value is rendered
+    behind a toggle, and its widgets are built only once it is expanded.
+    Sections of recursive models are always expanded on demand: behind a toggle, or as lists starting empty.
+    The nested models, lists and unions of a model at `max_depth` (the model itself being at `depth`)
+    are not rendered, and keep their initial value. Static forms cannot expand sections on demand, so without
+    a `max_depth` they stop at the first nested section of a recursive model.
+    """
+    store = store if store is not None else FormStore.of(base_key)
+    subtree_start = perf_counter() if instrumentation is not None else 0.0
     raw_input_values = {}
-    for name, field in model.model_fields.items():
-        try:
-            builder = extract_widget_builder_from_metadata(field.metadata)
-            if value is not None:
-                builder.default = getattr(value, name)
-            elif field.default is not PydanticUndefined:
-                builder.default = field.default
-            raw_input_values[name] = builder.build(form, randomize_key=False, kwargs={"key": f"{base_key}.{name}"})
-
-        except NoWidgetBuilderFoundError:
-            if field.annotation is None:
-                raise
-            if (
-                isinstance(field.annotation, GenericAlias)
-                and (origin := get_origin(field.annotation)) in SUPPORTED_GENERIC_ALIAS
-            ):
-                if origin is list:
-                    if form is not None:
-                        msg = "List fields are not supported in static forms"
-                        raise ValueError(msg) from None
-                    with st.container(border=True):
-                        raw_input_values[name] = models_list_to_input_components(
-                            get_args(field.annotation)[0],
-                            key=f"{base_key}.{name}",
-                            value=getattr(value, name, None),
-                        )
-                else:
-                    raise
-            elif isclass(field.annotation) and issubclass(field.annotation, BaseModel):
-                with st.container(border=True):
-                    raw_input_values[name] = model_to_input_components(
-                        field.annotation,
-                        base_key=f"{base_key}.{name}",
-                        form=form,
-                        value=getattr(value, name, None),
-                    )
-            else:
-                raise
-
-    return model(**raw_input_values)
-
-
-def models_list_to_input_components(model: type[T], *, key: str, value: Sequence[T] | None = None) -> list[T]:
-    n_items = int(st.number_input(f"Number of `{model.__name__}` items", min_value=0, value=1))
-    st.session_state[f"{key}:__n_items"] = n_items
+    render_subtree = partial(
+        model_to_input_components,
+        form=form,
+        list_page_size=list_page_size,
+        store=store,
+        instrumentation=instrumentation,
+        subtree_fragments=subtree_fragments,
+        collapsed_sections=collapsed_sections,
+        max_depth=max_depth,
+        depth=depth + 1,
+    )
+    for node in compile_form_plan(model).nodes:
+        key = base_key + node.key_suffix
+        if node.kind == "widget":
+            raw_input_values[node.name] = _build_widget(
+                node,
+                key,
+                node.initial_value(value),
+                form=form,
+                store=store,
+                instrumentation=instrumentation,
+            )
+        elif node.kind == "const":
+            raw_input_values[node.name] = node.default
+        elif _too_deep(node, depth, max_depth, static=form is not None):
+            _skip_too_deep(node, key, node.initial_value(value), raw_input_values, form=form, store=store)
+        elif node.kind == "union":
+            with st.container(border=True):
+                raw_input_values[node.name] = _union_section(
+                    node,
+                    key,
+                    node.initial_value(value),
+                    render_subtree,
+                    form=form,
+                    store=store,
+                )
+        elif node.kind == "list":
+            if form is not None:
+                msg = "List fields are not supported in static forms"
+                raise ValueError(msg)
+            with st.container(border=True):
+                raw_input_values[node.name] = models_list_to_input_components(
+                    node.plan.model,
+                    key=key,
+                    value=getattr(value, node.name, None),
+                    list_page_size=list_page_size,
+                    store=store,
+                    instrumentation=instrumentation,
+                    subtree_fragments=subtree_fragments,
+                    collapsed_sections=collapsed_sections,
+                    max_depth=max_depth,
+                    depth=depth + 1,
+                )
+        else:
+            initial = node.initial_value(value)
+            render = partial(
+                render_subtree,
+                node.plan.model,
+                base_key=key,
+                value=initial if isinstance(initial, BaseModel) else None,
+            )
+            with st.container(border=True):
+                raw_input_values[node.name] = _collapsible_section(
+                    node,
+                    key,
+                    initial,
+                    partial(_subtree_fragment, render) if subtree_fragments else render,
+                    collapsed_sections=collapsed_sections or is_recursive(node.plan.model),
+                    form=form,
+                    store=store,
+                    instrumentation=instrumentation,
+                )
+        _show_submit_error(key, form, store)
+
+    if base_key == store.base_key:
+        _show_submit_error(base_key, form, store)
+    validated = _validate_subtree(model, base_key, raw_input_values, store, instrumentation)
+    if instrumentation is not None:
+        instrumentation.subtree_rendered(_field_path(base_key, store), perf_counter() - subtree_start)
+    return validated
+
+
+def _too_deep(node: FieldNode, depth: int, max_depth: int | None, *, static: bool) -> bool:
+    if max_depth is not None:
+        return depth >= max_depth
+    return static and any(map(is_recursive, node.models))
+
+
+def _skip_too_deep(
+    node: FieldNode,
+    key: str,
+    initial: Any,
+    raw_input_values: dict[str, Any],
+    *,
+    form: DeltaGenerator | None,
+    store: FormStore,
+) -> None:
+    """Keep the initial value of a field nested deeper than the maximum depth, without rendering it."""
+    (st if form is None else form).caption(f"`{node.label}` is nested too deeply to be edited")
+    store.depth_limited[key] = initial
+    if initial is not PydanticUndefined:
+        raw_input_values[node.name] = initial
+
+
+def _build_widget(
+    node: FieldNode,
+    key: str,
+    initial: Any,
+    *,
+    form: DeltaGenerator | None,
+    store: FormStore,
+    instrumentation: Instrumentation | None,
+) -> Any:
+    builder = node.builder
+    assert builder is not None
+    # The builder is shared by every session, so the initial value is passed per call, never stored on it
+    start = perf_counter() if instrumentation is not None else 0.0
+    widget_value = builder.build(
+        form,
+        randomize_key=False,
+        value=None if initial is PydanticUndefined else builder.to_widget_value(initial),
+        kwargs={"key": key},
+    )
+    if instrumentation is not None:
+        instrumentation.widget_built(_field_path(key, store), perf_counter() - start)
+    return widget_value
+
+
+def _union_section(
+    node: FieldNode,
+    key: str,
+    initial: Any,
+    render_variant: Callable[..., BaseModel],
+    *,
+    form: DeltaGenerator | None,
+    store: FormStore,
+) -> BaseModel:
+    """Render a selector of the variant of a discriminated union, and the widgets of the selected variant only.
+
+    The widget values of the other variants are kept in session state, so switching back to a variant
+    restores them. The selected variant is validated on its own, so pydantic validates the union by its tag.
+    In static forms, the selector does not rerun the script, so a new variant is rendered after submitting.
+    """
+    assert node.discriminator is not None
+    tags = [tag for tag, _ in node.variants]
+    initial_tag = getattr(initial, node.discriminator, tags[0])
+    selectbox = st.selectbox if form is None else form.selectbox
+    tag = selectbox(
+        node.label,
+        options=tags,
+        index=tags.index(initial_tag) if initial_tag in tags else 0,
+        key=f"{key}:__variant",
+    )
+    for other_tag, other_variant in node.variants:
+        if other_tag != tag:
+            _keep_widget_state(f"{key}.{other_tag}", other_variant, store)
+    variant = dict(node.variants)[tag]
+    return render_variant(
+        variant,
+        base_key=f"{key}.{tag}",
+        value=initial if type(initial) is variant else None,
+    )
+
+
+def models_list_to_input_components(
+    model: type[T],
+    *,
+    key: str,
+    value: Sequence[T] | None = None,
+    list_page_size: int | None = None,
+    store: FormStore,
+    instrumentation: Instrumentation | None = None,
+    subtree_fragments: bool = False,
+    collapsed_sections: bool = False,
+    max_depth: int | None = None,
+    depth: int = 0,
+) -> list[T]:
+    """Render the input widgets of a list of models.
+
+    If `list_page_size` is given, only the widgets of the items on the selected page are built.
+    The items on the other pages keep their values in session state, and items that have never been
+    displayed take their prefilled value or the values their widgets would start with.
+    When the number of items decreases, the state of the removed items is pruned from session state.
+    A list of a recursive model starts empty, so that its subtrees are only built once items are added.
+    """
+    n_items = int(
+        st.number_input(
+            f"Number of `{model.__name__}` items",
+            min_value=0,
+            value=0 if is_recursive(model) else 1,
+            key=f"{key}:__n_items_input",
+        ),
+    )
+    if n_items < (previous_n_items := store.n_items.get(key, 0)):
+        store.prune(tuple(f"{key}[{idx}]" for idx in range(n_items, previous_n_items)))
+    store.n_items[key] = n_items
 
     def get_default_value(value: Sequence[T] | None, idx: int) -> T | None:
         if value is None:
@@ -252,11 +773,151 @@ def models_list_to_input_components(model: type[T], *, key: str, value: Sequence
         except IndexError:
             return None
 
-    return [
-        model_to_input_components(
-            model,
-            base_key=f"{key}[{idx}]",
-            value=get_default_value(value, idx),
-        )
-        for idx in range(n_items)
-    ]
+    visible = range(n_items)
+    if list_page_size is not None and n_items > list_page_size:
+        n_pages = -(-n_items // list_page_size)
+        page_key = f"{key}:__page"
+        if st.session_state.get(page_key, 1) > n_pages:
+            st.session_state[page_key] = n_pages
+        # No `value`: the page starts at `min_value`, and is set through session state only
+        page = int(st.number_input("Page", min_value=1, max_value=n_pages, key=page_key))
+        visible = range((page - 1) * list_page_size, min(page * list_page_size, n_items))
+
+    items = []
+    for idx in range(n_items):
+        if idx in visible:
+            render = partial(
+                model_to_input_components,
+                model,
+                base_key=f"{key}[{idx}]",
+                value=get_default_value(value, idx),
+                list_page_size=list_page_size,
+                store=store,
+                instrumentation=instrumentation,
+                subtree_fragments=subtree_fragments,
+                collapsed_sections=collapsed_sections,
+                max_depth=max_depth,
+                depth=depth,
+            )
+            item = _subtree_fragment(render) if subtree_fragments else render()
+        else:
+            item = _restore_hidden_item(f"{key}[{idx}]", model, get_default_value(value, idx), store, instrumentation)
+        items.append(item)
+    return items
+
+
+def _show_submit_error(key: str, form: DeltaGenerator | None, store: FormStore) -> None:
+    if store.errors and (error := store.errors.get(_field_path(key, store))) is not None:
+        (st if form is None else form).error(error)
+
+
+@st.fragment
+def _subtree_fragment(render: Callable[[], T]) -> T:
+    # Fragments are identified by their position on the page, so each section gets its own
+    return render()
+
+
+def _collapsible_section(
+    node: FieldNode,
+    key: str,
+    initial: Any,
+    render: Callable[[], BaseModel],
+    *,
+    collapsed_sections: bool,
+    form: DeltaGenerator | None,
+    store: FormStore,
+    instrumentation: Instrumentation | None,
+) -> Any:
+    """Render a nested model, behind a toggle if it is optional or if `collapsed_sections` is true and it has a value.
+
+    An optional model is `None` while its toggle is off. A collapsed section builds no widgets:
+    its value is restored from the widget values kept in session state, or else is its initial value.
+    In static forms, the toggle does not rerun the script, so the widgets are always built.
+    """
+    assert node.model is not None
+    if not node.optional and not (collapsed_sections and initial is not PydanticUndefined):
+        return render()
+    toggle = st.toggle if form is None else form.toggle
+    expanded = toggle(
+        node.label if node.optional else f"Edit `{node.label}`",
+        value=node.optional and initial not in (None, PydanticUndefined),
+        key=f"{key}:__expanded",
+    )
+    if expanded or form is not None:
+        section_value = render()
+        return section_value if expanded or not node.optional else None
+    if node.optional:
+        _keep_widget_state(key, node.model, store)
+        return None
+    return _restore_hidden_item(key, node.model, initial, store, instrumentation)
+
+
+def _keep_widget_state(base_key: str, model: type[BaseModel], store: FormStore) -> None:
+    """Keep the widget values of a model whose widgets are not rendered in this run.
+
+    Streamlit drops the state of widgets that are not rendered, unless it is reassigned
+    through the Session State API.
+    """
+    for node in compile_form_plan(model).nodes:
+        key = base_key + node.key_suffix
+        if node.kind == "model":
+            _keep_keys(f"{key}:__expanded")
+            # a recursive model has state only down to the sections that have been rendered
+            if not is_recursive(node.plan.model) or f"{key}:__expanded" in st.session_state or key in store.validated:
+                _keep_widget_state(key, node.plan.model, store)
+        elif node.kind == "list":
+            _keep_keys(f"{key}:__n_items_input", f"{key}:__page")
+            for idx in range(store.n_items.get(key, 0)):
+                _keep_widget_state(f"{key}[{idx}]", node.plan.model, store)
+        elif node.kind == "union":
+            _keep_keys(f"{key}:__variant")
+            for tag, variant in node.variants:
+                if not is_recursive(variant) or f"{key}.{tag}" in store.validated:
+                    _keep_widget_state(f"{key}.{tag}", variant, store)
+        else:
+            _keep_keys(key)
+
+
+def _keep_keys(*keys: str) -> None:
+    for key in keys:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
+
+
+def _restore_hidden_item(
+    base_key: str,
+    model: type[T],
+    value: T | None,
+    store: FormStore,
+    instrumentation: Instrumentation | None,
+) -> T:
+    _keep_widget_state(base_key, model, store)
+    try:
+        return restore_object_from_session_state(base_key, model, store=store, instrumentation=instrumentation)
+    except KeyError:  # never displayed yet
+        return value if value is not None else _initial_object(model)
+
+
+def _initial_object(model: type[T]) -> T:
+    """Return the value of a model whose widgets have never been built, as their first render would give it."""
+    return model.model_validate(
+        {
+            node.name: initial
+            for node in compile_form_plan(model).nodes
+            if (initial := _initial_field_value(node)) is not PydanticUndefined
+        },
+    )
+
+
+def _initial_field_value(node: FieldNode) -> Any:
+    if (initial := node.initial_value(None)) is not PydanticUndefined:
+        return initial
+    if node.builder is not None:
+        return node.builder.initial_widget_value()
+    if node.kind == "model":
+        return None if node.optional else _initial_object(node.plan.model)
+    if node.kind == "list":
+        return [] if is_recursive(node.plan.model) else [_initial_object(node.plan.model)]
+    if node.kind == "union":
+        return _initial_object(node.variants[0][1])
+    return PydanticUndefined
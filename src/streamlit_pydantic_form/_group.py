@@ -0,0 +1,110 @@
+__all__ = [
+    "FormGroup",
+]
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Any, Self, TypeVar
+
+import streamlit as st
+from pydantic import BaseModel, ValidationError
+
+from ._form import SESSION_STATE_KEY_PREFIX, model_to_input_components
+from ._instrumentation import Instrumentation
+from ._store import FormStore
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class FormGroup:
+    """Several models entered in a single `st.form`, with a single submit button.
+
+    Each model is rendered in a section of its own, and all of them are validated in the same run, so that
+    submitting the group reruns the script once instead of once per form. A section whose inputs are invalid
+    shows its errors and has a value of `None`; the other sections are still validated.
+
+    Example:
+    -------
+    ```python
+    with FormGroup("settings", models={"profile": ProfileModel, "billing": BillingModel}) as group:
+        group.input_widgets()
+        if group.form_submit_button("Save all"):
+            save(group.value("profile", ProfileModel), group.value("billing", BillingModel))
+    ```
+
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        models: Mapping[str, type[BaseModel]],
+        clear_on_submit: bool = False,
+        border: bool = True,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        self.models = dict(models)
+        self.key = key
+        self.form = st.form(key=self.key, clear_on_submit=clear_on_submit, border=border)
+        self.instrumentation = instrumentation
+        self.errors: dict[str, ValidationError] = {}
+        self._values: dict[str, BaseModel | None] = {}
+
+    @property
+    def _session_state_base_key(self) -> str:
+        return f"{SESSION_STATE_KEY_PREFIX}:{self.key}"
+
+    def clear(self) -> None:
+        """Reset the inputs of every section, removing their values from session state."""
+        FormStore.of(self._session_state_base_key).clear()
+
+    def input_widgets(self) -> dict[str, BaseModel | None]:
+        """Render the sections and return the value of each model by name, or `None` if it is invalid."""
+        store = FormStore.of(self._session_state_base_key)
+        values: dict[str, BaseModel | None] = {}
+        self.errors = {}
+        for name, model in self.models.items():
+            section = self.form.container(border=True)
+            try:
+                values[name] = model_to_input_components(
+                    model,
+                    form=section,
+                    base_key=f"{self._session_state_base_key}.{name}",
+                    store=store,
+                    instrumentation=self.instrumentation,
+                )
+            except ValidationError as e:
+                self.errors[name] = e
+                values[name] = None
+                section.error(
+                    "\n".join(f"- `{'.'.join(map(str, error['loc']))}`: {error['msg']}" for error in e.errors()),
+                )
+        self._values = values
+        return values
+
+    def value(self, name: str, model: type[T]) -> T | None:
+        """Return the value of the section `name` rendered by `input_widgets`, or `None` if it is invalid.
+
+        `model` is the section's model, given so that the value is typed as such.
+        """
+        if self.models[name] is not model:
+            msg = f"The section `{name}` is a `{self.models[name].__name__}`, not a `{model.__name__}`"
+            raise TypeError(msg)
+        return self._values[name]  # ty: ignore[invalid-return-type]
+
+    def form_submit_button(self, *args: Any, **kwargs: Any) -> bool:
+        """Display the group's submit button, which returns `True` only if every section is valid."""
+        return self.form.form_submit_button(*args, **kwargs) and not self.errors
+
+    def __enter__(self) -> Self:
+        # Enter the inner st.form
+        self.form.__enter__()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # Exit the inner st.form
+        self.form.__exit__(exc_type, exc_value, traceback)
@@ -0,0 +1,136 @@
+__all__ = [
+    "FieldProfile",
+    "FormProfile",
+    "Instrumentation",
+]
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Protocol
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+
+
+class Instrumentation(Protocol):
+    """Callbacks receiving the timings of a form's rendering and validation.
+
+    Field paths are relative to the form, e.g. `child.points[0].x`; the root model's path is `""`.
+    When no instrumentation is given to a form, none of the timings are measured.
+    """
+
+    def widget_built(self, path: str, seconds: float) -> None:
+        """Receive the time taken to build the widget of the field at `path`."""
+
+    def subtree_rendered(self, path: str, seconds: float) -> None:
+        """Receive the time taken to build the widgets of the (nested) model at `path` and validate it."""
+
+    def model_validated(self, path: str, seconds: float) -> None:
+        """Receive the time taken to validate the (nested) model at `path`."""
+
+    def validation_cache_hit(self, path: str) -> None:
+        """Signal that the (nested) model at `path` is reused without being validated again."""
+
+
+@dataclass
+class FieldProfile:
+    path: str
+    widgets: int = 0
+    widget_seconds: float = 0.0
+    render_seconds: float = 0.0
+    validations: int = 0
+    validation_seconds: float = 0.0
+    cache_hits: int = 0
+
+
+@dataclass
+class FormProfile:
+    """Instrumentation collecting per-field timings, to be shown in a table or exported as JSON.
+
+    Example:
+    -------
+    ```python
+    profile = FormProfile()
+    with StaticForm("form", model=MyModel, instrumentation=profile) as form:
+        value = form.input_widgets()
+        form.form_submit_button("Submit")
+    profile.render(st.sidebar)
+    ```
+
+    """
+
+    fields: dict[str, FieldProfile] = field(default_factory=dict)
+
+    def _field(self, path: str) -> FieldProfile:
+        if (profile := self.fields.get(path)) is None:
+            profile = self.fields[path] = FieldProfile(path)
+        return profile
+
+    def widget_built(self, path: str, seconds: float) -> None:
+        profile = self._field(path)
+        profile.widgets += 1
+        profile.widget_seconds += seconds
+
+    def subtree_rendered(self, path: str, seconds: float) -> None:
+        self._field(path).render_seconds += seconds
+
+    def model_validated(self, path: str, seconds: float) -> None:
+        profile = self._field(path)
+        profile.validations += 1
+        profile.validation_seconds += seconds
+
+    def validation_cache_hit(self, path: str) -> None:
+        self._field(path).cache_hits += 1
+
+    @property
+    def n_widgets(self) -> int:
+        return sum(profile.widgets for profile in self.fields.values())
+
+    @property
+    def widget_seconds(self) -> float:
+        return sum(profile.widget_seconds for profile in self.fields.values())
+
+    @property
+    def validation_seconds(self) -> float:
+        return sum(profile.validation_seconds for profile in self.fields.values())
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(profile.cache_hits for profile in self.fields.values())
+
+    def reset(self) -> None:
+        """Forget the timings collected so far."""
+        self.fields.clear()
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "n_widgets": self.n_widgets,
+                "widget_seconds": self.widget_seconds,
+                "validation_seconds": self.validation_seconds,
+                "cache_hits": self.cache_hits,
+                "fields": [asdict(profile) for profile in self.fields.values()],
+            },
+        )
+
+    def render(self, container: DeltaGenerator | None = None) -> None:
+        """Render the profile as a table, e.g. in `st.sidebar`."""
+        container = container if container is not None else st.container()
+        container.caption(
+            f"{self.n_widgets} widgets in {self.widget_seconds * 1000:.1f} ms, "
+            f"validation in {self.validation_seconds * 1000:.1f} ms, {self.cache_hits} cache hits",
+        )
+        container.dataframe(
+            [
+                {
+                    "path": profile.path or "<root>",
+                    "widgets": profile.widgets,
+                    "widget ms": profile.widget_seconds * 1000,
+                    "render ms": profile.render_seconds * 1000,
+                    "validations": profile.validations,
+                    "validation ms": profile.validation_seconds * 1000,
+                    "cache hits": profile.cache_hits,
+                }
+                for profile in self.fields.values()
+            ],
+            hide_index=True,
+        )
@@ -0,0 +1,118 @@
+__all__ = [
+    "OptionProvider",
+]
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from itertools import islice, takewhile
+from threading import Lock
+from time import monotonic
+from typing import Any, Literal
+
+import streamlit as st
+
+
+@dataclass
+class _OptionCache:
+    expires_at: float = float("-inf")
+    labels: list[str] = field(default_factory=list)
+    options: list[Any] = field(default_factory=list)
+    pages: OrderedDict[str, list[Any]] = field(default_factory=OrderedDict)
+    # Held while loading, so that a slow `load` only blocks the searches of its own cache
+    lock: Lock = field(default_factory=Lock)
+
+
+# Keyed by provider name, so that a provider defined in the script body keeps its options across reruns
+_GLOBAL_CACHES: dict[str, _OptionCache] = {}
+_GLOBAL_CACHES_LOCK = Lock()
+
+
+class OptionProvider:
+    """Options of a `Selectbox`, `Multiselect` or `Radio` loaded lazily, e.g. from a database.
+
+    `load` is called on first use and again once `ttl` seconds have passed (never if `ttl` is `None`).
+    The loaded options are cached for all sessions, or for each session if `scope` is `"session"`,
+    under `name`, which defaults to the qualified name of `load`. It must be given when `load` is a lambda,
+    as all lambdas of a module share a qualified name; a `ValueError` is raised otherwise.
+    Only the first `page_size` options whose label starts with the search text are sent to the browser,
+    sorted by label; the pages of the last `max_entries` searches are cached.
+
+    Example:
+    -------
+    ```python
+    cities = OptionProvider(lambda: db.fetch_city_names(), ttl=3600, name="cities")
+
+
+    class FormModel(BaseModel):
+        city: Annotated[str, widget.Selectbox("City", options=cities)]
+    ```
+
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], Iterable[Any]],
+        *,
+        ttl: float | None = 300.0,
+        max_entries: int = 128,
+        page_size: int = 100,
+        scope: Literal["global", "session"] = "global",
+        label: Callable[[Any], str] = str,
+        name: str | None = None,
+    ) -> None:
+        self.load = load
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.page_size = page_size
+        self.scope = scope
+        self.label = label
+        if name is None:
+            qualname = getattr(load, "__qualname__", None) or str(id(load))
+            if "<lambda>" in qualname:
+                msg = "OptionProvider needs a `name` when `load` is a lambda"
+                raise ValueError(msg)
+            name = f"{load.__module__}.{qualname}"
+        self.name = name
+
+    def _cache(self) -> _OptionCache:
+        if self.scope == "global":
+            with _GLOBAL_CACHES_LOCK:
+                return _GLOBAL_CACHES.setdefault(self.name, _OptionCache())
+        key = f"streamlit_pydantic_form:options:{self.name}"
+        if not isinstance(cache := st.session_state.get(key), _OptionCache):
+            cache = st.session_state[key] = _OptionCache()
+        return cache
+
+    def _refresh(self, cache: _OptionCache) -> None:
+        if monotonic() < cache.expires_at:
+            return
+        entries = sorted(((self.label(option).casefold(), option) for option in self.load()), key=lambda e: e[0])
+        cache.labels = [label for label, _ in entries]
+        cache.options = [option for _, option in entries]
+        cache.pages.clear()
+        cache.expires_at = monotonic() + self.ttl if self.ttl is not None else float("inf")
+
+    def search(self, prefix: str = "") -> list[Any]:
+        """Return the first page of options whose label starts with `prefix`, ignoring case."""
+        prefix = prefix.casefold()
+        cache = self._cache()
+        with cache.lock:
+            self._refresh(cache)
+            if (page := cache.pages.get(prefix)) is not None:
+                cache.pages.move_to_end(prefix)
+                return page
+
+            start = bisect_left(cache.labels, prefix)
+            matches = takewhile(lambda idx: cache.labels[idx].startswith(prefix), range(start, len(cache.labels)))
+            page = [cache.options[idx] for idx in islice(matches, self.page_size)]
+            cache.pages[prefix] = page
+            if len(cache.pages) > self.max_entries:
+                cache.pages.popitem(last=False)
+            return page
+
+    def invalidate(self) -> None:
+        """Reload the options on next use."""
+        cache = self._cache()
+        with cache.lock:
+            cache.expires_at = float("-inf")
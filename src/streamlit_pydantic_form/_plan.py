@@ -0,0 +1,130 @@
+__all__ = [
+    "FieldNode",
+    "FormPlan",
+    "compile_form_plan",
+    "is_recursive",
+]
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, get_args
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
+
+from ._resolver import FieldKind, resolve_field, union_variants
+from .widget import WidgetBuilder
+
+
+@dataclass(frozen=True, slots=True)
+class FieldNode:
+    """A field of a model, resolved once into everything needed to render and restore it."""
+
+    name: str
+    kind: FieldKind
+    key_suffix: str
+    label: str
+    default: Any
+    default_factory: Callable[[], Any] | None = None
+    builder: WidgetBuilder[Any] | None = None
+    model: type[BaseModel] | None = None
+    optional: bool = False
+    discriminator: str | None = None
+    variants: tuple[tuple[Any, type[BaseModel]], ...] = ()
+
+    def initial_value(self, value: BaseModel | None) -> Any:
+        """Return the initial value of the field: prefilled from `value`, or its default.
+
+        It is `PydanticUndefined` if there is neither.
+        """
+        if value is not None:
+            return getattr(value, self.name)
+        if self.default is PydanticUndefined and self.default_factory is not None:
+            return self.default_factory()
+        return self.default
+
+    @property
+    def models(self) -> tuple[type[BaseModel], ...]:
+        """Models nested in the field: its model, list item model, or union variants."""
+        if self.model is not None:
+            return (self.model,)
+        return tuple(model for _, model in self.variants)
+
+    @property
+    def plan(self) -> "FormPlan":
+        """Plan of the nested model (or of the list item model).
+
+        It is looked up lazily so that each model class is compiled only once,
+        however many times it appears in the tree.
+        """
+        assert self.model is not None
+        return compile_form_plan(self.model)
+
+
+@dataclass(frozen=True, slots=True)
+class FormPlan:
+    """The flat list of field nodes of a model class, in declaration order."""
+
+    model: type[BaseModel]
+    nodes: tuple[FieldNode, ...]
+
+
+_PLAN_CACHE: WeakKeyDictionary[type[BaseModel], FormPlan] = WeakKeyDictionary()
+_RECURSIVE_CACHE: WeakKeyDictionary[type[BaseModel], bool] = WeakKeyDictionary()
+
+
+def compile_form_plan(model: type[BaseModel]) -> FormPlan:
+    """Return the form plan of `model`, compiling it on first use.
+
+    Forward references that could not be resolved when the model was defined, such as references
+    to models defined after it, are resolved first.
+    """
+    try:
+        return _PLAN_CACHE[model]
+    except KeyError:
+        pass
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+    plan = FormPlan(
+        model=model,
+        nodes=tuple(_compile_field(name, field) for name, field in model.model_fields.items()),
+    )
+    _PLAN_CACHE[model] = plan
+    return plan
+
+
+def _compile_field(name: str, field: FieldInfo) -> FieldNode:
+    kind, builder, model, optional = resolve_field(name, field)
+    discriminator = field.discriminator if kind == "union" else None
+    return FieldNode(
+        name=name,
+        kind=kind,
+        key_suffix=f".{name}",
+        label=field.title or name,
+        # a constant field's value is its single `Literal` value
+        default=get_args(field.annotation)[0] if kind == "const" else field.default,
+        default_factory=field.default_factory,  # ty: ignore[invalid-argument-type]
+        builder=builder,
+        model=model,
+        optional=optional,
+        discriminator=discriminator,  # ty: ignore[invalid-argument-type]
+        variants=union_variants(field.annotation, discriminator) if isinstance(discriminator, str) else (),
+    )
+
+
+def is_recursive(model: type[BaseModel]) -> bool:
+    """Return whether `model` is nested in itself, directly or through other models."""
+    try:
+        return _RECURSIVE_CACHE[model]
+    except KeyError:
+        pass
+    seen: set[type[BaseModel]] = set()
+    pending = [nested for node in compile_form_plan(model).nodes for nested in node.models]
+    while pending:
+        if (nested := pending.pop()) in seen:
+            continue
+        seen.add(nested)
+        pending.extend(grand for node in compile_form_plan(nested).nodes for grand in node.models)
+    recursive = _RECURSIVE_CACHE[model] = model in seen
+    return recursive
@@ -0,0 +1,140 @@
+__all__ = [
+    "FieldKind",
+    "WidgetResolver",
+    "register_widget_resolver",
+    "resolve_field",
+    "union_variants",
+]
+from collections.abc import Callable
+from datetime import date, datetime, time
+from enum import Enum
+from functools import cache
+from inspect import isclass
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from ._exceptions import NoWidgetBuilderFoundError
+from .widget import Checkbox, DateInput, NumberInput, Selectbox, TextInput, TimeInput, WidgetBuilder
+
+FieldKind = Literal["widget", "model", "list", "union", "const"]
+
+WidgetResolver = Callable[[Any, str, FieldInfo], WidgetBuilder[Any]]
+"""Callable creating the widget builder of a field from its annotation, label and field info."""
+
+_RESOLVERS: dict[Any, WidgetResolver] = {}
+
+
+def register_widget_resolver(annotation: Any, resolver: WidgetResolver) -> None:
+    """Register `resolver` for the fields annotated with `annotation`.
+
+    `annotation` is either a class, which also matches its subclasses (e.g. `Enum`),
+    or a generic origin / special form such as `list` or `Literal`. Enum classes match `Enum` before their
+    data type (e.g. `str` for a `StrEnum`), and `datetime` does not match `date`, whose widget drops the time.
+    Widget builders given explicitly in `Annotated` metadata always take precedence.
+    """
+    _RESOLVERS[annotation] = resolver
+    _lookup_resolver.cache_clear()
+
+
+def _resolution_order(cls: type) -> list[type]:
+    """Return the classes whose resolvers match `cls`, most specific first."""
+    mro = sorted(cls.__mro__, key=lambda base: not issubclass(base, Enum))  # stable, so each part keeps its order
+    if issubclass(cls, datetime):
+        mro = mro[: mro.index(datetime) + 1]
+    return mro
+
+
+@cache
+def _lookup_resolver(annotation: Any) -> WidgetResolver | None:
+    if (origin := get_origin(annotation)) is not None:
+        return _RESOLVERS.get(origin)
+    if isclass(annotation):
+        return next((_RESOLVERS[cls] for cls in _resolution_order(annotation) if cls in _RESOLVERS), None)
+    return _RESOLVERS.get(annotation)
+
+
+def _is_model(annotation: Any) -> bool:
+    return isclass(annotation) and issubclass(annotation, BaseModel)
+
+
+def _optional_model(annotation: Any) -> type[BaseModel] | None:
+    """Return `Model` if `annotation` is `Model | None`."""
+    if get_origin(annotation) not in (Union, UnionType):
+        return None
+    args = get_args(annotation)
+    if len(args) != 2 or NoneType not in args:
+        return None
+    (model,) = (arg for arg in args if arg is not NoneType)
+    return model if _is_model(model) else None
+
+
+def _widgetless_kind(field: FieldInfo) -> Literal["union", "const"] | None:
+    """Return the kind of a field whose value is not entered in a widget of its own."""
+    args = get_args(field.annotation)
+    if isinstance(field.discriminator, str) and all(map(_is_model, args)):
+        return "union"
+    if get_origin(field.annotation) is Literal and len(args) == 1:
+        return "const"
+    return None
+
+
+def resolve_field(
+    name: str,
+    field: FieldInfo,
+) -> tuple[FieldKind, WidgetBuilder[Any] | None, type[BaseModel] | None, bool]:
+    """Resolve how a field is rendered: its kind, its widget builder or nested model, and whether it is optional.
+
+    Only nested models can be optional (`Model | None`); they are rendered behind a toggle.
+    Discriminated unions of models are of kind `"union"`, and single-value `Literal`s, which need no widget,
+    of kind `"const"`.
+    """
+    for item in field.metadata:
+        if isinstance(item, WidgetBuilder):
+            return "widget", item.bind(field.annotation), None, False
+
+    annotation = field.annotation
+    if _is_model(annotation):
+        return "model", None, annotation, False
+    if (optional_model := _optional_model(annotation)) is not None:
+        return "model", None, optional_model, True
+    if get_origin(annotation) is list and _is_model(item_model := get_args(annotation)[0]):
+        return "list", None, item_model, False
+    if (kind := _widgetless_kind(field)) is not None:
+        return kind, None, None, False
+
+    try:
+        resolver = _lookup_resolver(annotation)
+    except TypeError:  # unhashable annotation
+        resolver = None
+    if resolver is None:
+        raise NoWidgetBuilderFoundError
+    return "widget", resolver(annotation, field.title or name, field), None, False
+
+
+def union_variants(annotation: Any, discriminator: str) -> tuple[tuple[Any, type[BaseModel]], ...]:
+    """Return the pairs of tag and model of a discriminated union, in declaration order."""
+    variants = []
+    for model in get_args(annotation):
+        tag_annotation = model.model_fields[discriminator].annotation
+        if get_origin(tag_annotation) is not Literal:
+            msg = f"The discriminator `{discriminator}` of `{model.__name__}` must be annotated with a `Literal`"
+            raise TypeError(msg)
+        variants.extend((tag, model) for tag in get_args(tag_annotation))
+    return tuple(variants)
+
+
+register_widget_resolver(bool, lambda _, label, __: Checkbox(label))
+register_widget_resolver(int, lambda _, label, __: NumberInput(label, step=1))
+register_widget_resolver(float, lambda _, label, __: NumberInput(label))
+register_widget_resolver(str, lambda _, label, __: TextInput(label))
+register_widget_resolver(date, lambda _, label, __: DateInput(label))
+register_widget_resolver(time, lambda _, label, __: TimeInput(label))
+register_widget_resolver(Literal, lambda annotation, label, _: Selectbox(label, options=get_args(annotation)))
+# Enum members are offered by value, so that the choice survives the enum class being redefined on reruns
+register_widget_resolver(
+    Enum,
+    lambda annotation, label, _: Selectbox(label, options=[member.value for member in annotation]),
+)
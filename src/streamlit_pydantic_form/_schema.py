@@ -0,0 +1,205 @@
+__all__ = [
+    "model_from_json_schema",
+]
+import hashlib
+import json
+import re
+from datetime import date, time
+from inspect import isclass
+from threading import Lock
+from typing import Annotated, Any, ForwardRef, Literal
+
+from pydantic import BaseModel, BeforeValidator, Field, create_model
+from pydantic.fields import FieldInfo
+
+from . import widget
+from ._plan import compile_form_plan
+from ._resolver import resolve_field
+
+_JSON_TYPES: dict[str, type] = {"string": str, "integer": int, "number": float, "boolean": bool}
+_STRING_FORMATS: dict[str, type] = {"date": date, "time": time}
+_CONSTRAINTS = {
+    "minimum": "ge",
+    "maximum": "le",
+    "exclusiveMinimum": "gt",
+    "exclusiveMaximum": "lt",
+    "minLength": "min_length",
+    "maxLength": "max_length",
+    "pattern": "pattern",
+    "minItems": "min_length",
+    "maxItems": "max_length",
+}
+
+_MODEL_CACHE: dict[str, type[BaseModel]] = {}
+_LOCK = Lock()
+
+
+def model_from_json_schema(schema: dict[str, Any]) -> type[BaseModel]:
+    """Return a model class for a JSON Schema object, creating it only once per distinct schema.
+
+    Objects become (nested) models, arrays of objects become `list[Model]` fields, arrays of strings or numbers
+    become text areas with one item per line and `enum`s become `Literal`s; `$ref`s to `$defs` are followed,
+    including recursive ones. The widget of a property can be chosen with an `x-widget` extension naming a builder
+    of `streamlit_pydantic_form.widget`, with its keyword arguments:
+
+    ```json
+    {"type": "integer", "x-widget": {"builder": "Slider", "min_value": 0, "max_value": 10}}
+    ```
+
+    The model class and its form plan are cached by the schema's hash, so forms defined from the same schema
+    on every rerun reuse them.
+    """
+    digest = hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+    with _LOCK:
+        if (model := _MODEL_CACHE.get(digest)) is None:
+            builder = _SchemaBuilder(schema)
+            model = builder.model(schema, schema.get("title", "Model"))
+            builder.resolve_recursive_refs()
+            compile_form_plan(model)
+            _MODEL_CACHE[digest] = model
+    return model
+
+
+class _SchemaBuilder:
+    def __init__(self, root: dict[str, Any]) -> None:
+        self.root = root
+        self.models: dict[str, type[BaseModel]] = {}
+        self.building: set[str] = set()
+
+    def model(self, schema: dict[str, Any], name: str) -> Any:
+        if (ref := schema.get("$ref")) is not None:
+            if (model := self.models.get(ref)) is not None:
+                return model
+            name = _model_name(ref.rsplit("/", 1)[-1])
+            if ref in self.building:  # a recursive reference, resolved once the model is created
+                return ForwardRef(name)
+            self.building.add(ref)
+            model = self.models[ref] = self.model(self.deref(ref), name)
+            self.building.discard(ref)
+            return model
+        required = set(schema.get("required", ()))
+        fields: dict[str, Any] = {
+            prop_name: self.field(prop_schema, prop_name, required=prop_name in required)
+            for prop_name, prop_schema in schema.get("properties", {}).items()
+        }
+        return create_model(_model_name(name), **fields)
+
+    def resolve_recursive_refs(self) -> None:
+        namespace = {model.__name__: model for model in self.models.values()}
+        for model in self.models.values():
+            if not model.__pydantic_complete__:
+                model.model_rebuild(_types_namespace=namespace)
+
+    def deref(self, ref: str) -> dict[str, Any]:
+        if not ref.startswith("#/"):
+            msg = f"Only local `$ref`s are supported, got `{ref}`"
+            raise ValueError(msg)
+        target: Any = self.root
+        for part in ref[2:].split("/"):
+            target = target[part]
+        return target
+
+    def inline(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Replace a `$ref` to a schema that is not an object, e.g. an enum, by the schema it refers to.
+
+        The keywords next to the `$ref`, such as `default`, take precedence over those of its target.
+        """
+        if (ref := schema.get("$ref")) is None:
+            return schema
+        target = self.deref(ref)
+        if target.get("type") == "object" or "properties" in target:
+            return schema
+        # The title of the target names the referenced type, not the field
+        inlined = {keyword: value for keyword, value in self.inline(target).items() if keyword != "title"}
+        return inlined | {keyword: value for keyword, value in schema.items() if keyword != "$ref"}
+
+    def field(self, schema: dict[str, Any], name: str, *, required: bool) -> tuple[Any, FieldInfo]:
+        schema = self.inline(schema)
+        annotation = self.annotation(schema, name)
+        field_kwargs = {kwarg: schema[keyword] for keyword, kwarg in _CONSTRAINTS.items() if keyword in schema}
+        field = Field(
+            schema.get("default", ... if required else None),
+            title=schema.get("title"),
+            description=schema.get("description"),
+            **field_kwargs,
+        )
+        metadata = self.widget_builder(schema, name)
+        return (Annotated[annotation, metadata] if metadata is not None else annotation), field
+
+    def annotation(self, schema: dict[str, Any], name: str) -> Any:
+        schema = self.inline(schema)
+        if "$ref" in schema:
+            return self.model(schema, name)
+        if "enum" in schema:
+            return Literal[tuple(schema["enum"])]  # ty: ignore[invalid-type-form]
+        if (variants := schema.get("anyOf")) is not None:
+            non_null = [variant for variant in variants if variant.get("type") != "null"]
+            if len(non_null) == 1 and len(variants) == 2:
+                return self.annotation(non_null[0], name) | None
+        json_type = schema.get("type")
+        if json_type == "object":
+            return self.model(schema, schema.get("title", name))
+        if json_type == "array":
+            items = self.inline(schema.get("items", {}))
+            annotation = list[self.annotation(items, name)]  # ty: ignore[invalid-type-form]
+            return Annotated[annotation, BeforeValidator(_split_lines)] if _is_line_item(items) else annotation
+        cls = _STRING_FORMATS.get(schema.get("format", "")) if json_type == "string" else None
+        if (cls := cls or _JSON_TYPES.get(json_type)) is not None:
+            return cls
+        msg = f"Unsupported JSON Schema for field `{name}`: {schema}"
+        raise ValueError(msg)
+
+    def widget_builder(self, schema: dict[str, Any], name: str) -> widget.WidgetBuilder[Any] | None:
+        label = schema.get("title", name)
+        if (hint := schema.get("x-widget")) is not None:
+            hint = {"builder": hint} if isinstance(hint, str) else dict(hint)
+            builder = getattr(widget, builder_name := hint.pop("builder"), None)
+            if not (isclass(builder) and issubclass(builder, widget.WidgetBuilder)):
+                msg = f"`x-widget` of field `{name}` names `{builder_name}`, which is not a widget builder"
+                raise ValueError(msg)
+            return builder(label, **hint)
+        if schema.get("type") == "array":
+            return self.array_widget_builder(schema, name, label)
+        # Optional widgets get the builder of their non-null type, as unions have no default widget
+        variants = schema.get("anyOf", ())
+        non_null = [self.inline(variant) for variant in variants if variant.get("type") != "null"]
+        if len(variants) == 2 and len(non_null) == 1 and "$ref" not in non_null[0]:
+            if non_null[0].get("type") == "array":
+                return self.array_widget_builder(non_null[0], name, label)
+            inner = FieldInfo(annotation=self.annotation(non_null[0], name), title=label)
+            return resolve_field(name, inner)[1]
+        return None
+
+    def array_widget_builder(self, schema: dict[str, Any], name: str, label: str) -> widget.WidgetBuilder[Any] | None:
+        items = self.inline(schema.get("items", {}))
+        if "enum" in items:
+            return widget.Multiselect(label, options=items["enum"])
+        if _is_line_item(items):
+            return _LinesTextArea(label, help="One item per line")
+        if "$ref" in items or items.get("type") == "object" or "properties" in items:
+            return None  # a list of models, which has its own section
+        msg = (
+            f"Unsupported JSON Schema for field `{name}`: arrays of {items} have no widget, choose one with `x-widget`"
+        )
+        raise ValueError(msg)
+
+
+class _LinesTextArea(widget.TextArea):
+    """A text area editing a list of strings or numbers, one item per line."""
+
+    def to_widget_value(self, value: Any) -> Any:
+        return "\n".join(map(str, value)) if value is not None else None
+
+
+def _is_line_item(items: dict[str, Any]) -> bool:
+    return items.get("type") in {"string", "integer", "number"} and not {"enum", "format", "$ref"} & items.keys()
+
+
+def _split_lines(value: Any) -> Any:
+    if isinstance(value, str):
+        return [line.strip() for line in value.splitlines() if line.strip()]
+    return value
+
+
+def _model_name(name: str) -> str:
+    return re.sub(r"\W", "_", name) or "Model"
@@ -0,0 +1,149 @@
+__all__ = [
+    "JsonlSink",
+    "ParquetSink",
+    "SubmissionSink",
+]
+import atexit
+import json
+import logging
+import queue
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from time import monotonic, time_ns
+from typing import Any
+
+from pydantic import BaseModel
+
+from ._exceptions import SubmissionSinkFullError
+
+_logger = logging.getLogger(__name__)
+
+_CLOSE = object()
+
+
+class SubmissionSink(ABC):
+    """Destination of submitted form values, written by a background thread.
+
+    `submit` only queues the value, so the script does not wait for the storage.
+    The writer thread writes the queued values in batches of up to `batch_size` records, at the latest
+    `flush_interval` seconds after the first record of the batch was queued.
+    When `max_pending` records are waiting, `submit` blocks for up to `put_timeout` seconds and then raises
+    `SubmissionSinkFullError`, so that a slow storage slows down the submissions instead of exhausting memory.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        max_pending: int = 10_000,
+        put_timeout: float = 5.0,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._write_loop, name="streamlit_pydantic_form_sink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @abstractmethod
+    def write_batch(self, records: list[dict[str, Any]]) -> None:
+        """Write a batch of records, called from the writer thread only."""
+
+    def submit(self, value: BaseModel) -> None:
+        """Queue a submitted value to be written."""
+        try:
+            self._queue.put(value.model_dump(mode="json"), timeout=self.put_timeout)
+        except queue.Full:
+            raise SubmissionSinkFullError from None
+
+    def flush(self) -> None:
+        """Wait until every queued value has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the queued values and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_CLOSE)
+            self._thread.join()
+
+    def _write_loop(self) -> None:
+        closing = False
+        while not closing:
+            records: list[dict[str, Any]] = []
+            item = self._queue.get()
+            deadline = monotonic() + self.flush_interval
+            while True:
+                if item is _CLOSE:
+                    closing = True
+                else:
+                    records.append(item)
+                if closing or len(records) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(deadline - monotonic(), 0))
+                except queue.Empty:
+                    break
+            try:
+                if records:
+                    self.write_batch(records)
+            except Exception:
+                _logger.exception("Failed to write %d submitted records", len(records))
+            finally:
+                for _ in range(len(records) + closing):
+                    self._queue.task_done()
+
+
+class JsonlSink(SubmissionSink):
+    """Append the submitted values to a JSON Lines file, one batch per write.
+
+    Example:
+    -------
+    ```python
+    @st.cache_resource
+    def sink() -> JsonlSink:
+        return JsonlSink("submissions.jsonl")
+
+
+    form = DynamicForm("form", model=MyModel, sink=sink())
+    ```
+
+    """
+
+    def __init__(self, path: str | Path, **kwargs: Any) -> None:
+        self.path = Path(path)
+        super().__init__(**kwargs)
+
+    def write_batch(self, records: list[dict[str, Any]]) -> None:
+        with self.path.open("a", encoding="utf-8") as file:
+            file.writelines(json.dumps(record) + "\n" for record in records)
+
+
+class ParquetSink(SubmissionSink):
+    """Write each batch of submitted values to a new Parquet file in `directory`.
+
+    It requires `pyarrow`, installed with the `parquet` extra: `pip install streamlit-pydantic-form[parquet]`.
+    """
+
+    def __init__(self, directory: str | Path, **kwargs: Any) -> None:
+        # pyarrow is imported here rather than with the package, which most apps use without this sink
+        try:
+            import pyarrow.parquet  # noqa: F401, PLC0415
+        except ImportError:
+            msg = "`ParquetSink` requires pyarrow, install it with `pip install streamlit-pydantic-form[parquet]`"
+            raise ImportError(msg) from None
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(**kwargs)
+
+    def write_batch(self, records: list[dict[str, Any]]) -> None:
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        # Files are never appended to, so a reader never sees a partially written one
+        path = self.directory / f"part-{time_ns()}.parquet"
+        tmp_path = path.with_suffix(".tmp")
+        pq.write_table(pa.Table.from_pylist(records), tmp_path)
+        tmp_path.rename(path)
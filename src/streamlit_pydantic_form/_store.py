@@ -0,0 +1,58 @@
+__all__ = [
+    "FormStore",
+]
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+import streamlit as st
+
+from ._changeset import FieldChange
+
+
+@dataclass
+class FormStore:
+    """State of a form other than its widget values, kept as a single session state entry.
+
+    The store lives at the form's base key. Widget values must be top-level session state entries,
+    so they stay under `<base key>.<field path>` keys, which the store prunes along with its own entries.
+    """
+
+    base_key: str
+    submitted: bool = False
+    generation: int = 0
+    value: tuple[int, Any] | None = None
+    changes: list[FieldChange] = field(default_factory=list)
+    n_items: dict[str, int] = field(default_factory=dict)
+    validated: dict[str, tuple[dict[str, Any], Any]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    depth_limited: dict[str, Any] = field(default_factory=dict)
+    draft: dict[str, Any] | None = None
+    draft_restored: bool = False
+
+    @classmethod
+    def of(cls, base_key: str) -> Self:
+        """Return the store of the form at `base_key`, creating it on first use."""
+        store = st.session_state.get(base_key)
+        if not isinstance(store, cls):
+            store = cls(base_key)
+            st.session_state[base_key] = store
+        return store
+
+    def prune(self, prefixes: tuple[str, ...]) -> None:
+        """Remove the widget values and the stored state under any of the key prefixes."""
+        for key in [key for key in st.session_state if isinstance(key, str) and key.startswith(prefixes)]:
+            del st.session_state[key]
+        for entries in (self.n_items, self.validated, self.depth_limited):
+            for key in [key for key in entries if key.startswith(prefixes)]:
+                del entries[key]
+
+    def clear(self) -> None:
+        """Remove the widget values and the state derived from them, keeping the submission state."""
+        self.prune((f"{self.base_key}.",))
+        self.validated.pop(self.base_key, None)
+        self.errors.clear()
+
+    def dispose(self) -> None:
+        """Remove everything the form keeps in session state."""
+        self.clear()
+        st.session_state.pop(self.base_key, None)
@@ -0,0 +1,108 @@
+__all__ = [
+    "SubmitValidator",
+    "run_submit_validators",
+]
+import asyncio
+import inspect
+import logging
+import re
+from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cache
+from time import monotonic
+from typing import Any
+
+from pydantic import BaseModel
+
+SubmitValidator = Callable[[Any], Awaitable[None] | None]
+"""Blocking or async callable checking a field's value on submit, raising `ValueError` if it is invalid."""
+
+_logger = logging.getLogger(__name__)
+
+_MAX_WORKERS = 8
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    # Shared by every form and session, so that slow checks cannot start an unbounded number of threads
+    return ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="streamlit_pydantic_form")
+
+
+_PATH = re.compile(r"(?:\.?\w+|\[\d+\])*")
+_PATH_SEGMENT = re.compile(r"\.?(\w+)|\[(\d+)\]")
+_ABSENT = object()
+
+
+def _field_value(value: BaseModel, path: str) -> Any:
+    """Return the value at a field path such as `items[0].name`.
+
+    It is `_ABSENT` if the path goes through a list item or an optional model that the value does not have.
+    """
+    if not _PATH.fullmatch(path):
+        msg = f"`{path}` is not a field path"
+        raise ValueError(msg)
+    field_value: Any = value
+    for name, idx in _PATH_SEGMENT.findall(path):
+        if field_value is None or (idx and int(idx) >= len(field_value)):
+            return _ABSENT
+        if idx:
+            field_value = field_value[int(idx)]
+        elif isinstance(field_value, BaseModel) and name in type(field_value).model_fields:
+            field_value = getattr(field_value, name)
+        else:
+            msg = f"`{path}` is not a field path of `{type(value).__name__}`"
+            raise ValueError(msg)
+    return field_value
+
+
+def _check(validator: SubmitValidator, field_value: Any, deadline: float) -> None:
+    result = validator(field_value)
+    if inspect.isawaitable(result):
+        asyncio.run(_await(result, deadline))
+
+
+async def _await(awaitable: Awaitable[None], deadline: float) -> None:
+    # Cancelled once timed out, so that it frees its worker; blocking validators cannot be stopped
+    await asyncio.wait_for(awaitable, timeout=max(deadline - monotonic(), 0))
+
+
+def run_submit_validators(
+    value: BaseModel,
+    validators: Mapping[str, SubmitValidator],
+    timeout: float,
+) -> dict[str, str]:
+    """Run the submit validators of a form concurrently and return the error messages by field path.
+
+    Each validator receives the value of the field at its path (e.g. `child.name`, `items[0].name`, or `""` for
+    the whole model), and is skipped if the value has no such list item or optional model.
+    A `ValueError` is raised if a path does not match the model's fields.
+    A validator that does not finish within `timeout` seconds is reported as an error. Async validators are then
+    cancelled, but blocking ones keep their worker of the shared pool until they return.
+    Exceptions other than `ValueError` are logged and reported as a failed validation.
+    """
+    deadline = monotonic() + timeout
+    field_values = {path: _field_value(value, path) for path in validators}
+    futures: dict[Future[None], str] = {
+        _executor().submit(_check, validator, field_values[path], deadline): path
+        for path, validator in validators.items()
+        if field_values[path] is not _ABSENT
+    }
+    done, not_done = wait(futures, timeout=timeout)
+
+    timed_out = f"Validation timed out after {timeout:g} seconds"
+    errors: dict[str, str] = {}
+    for future in done:
+        path = futures[future]
+        try:
+            future.result()
+        except ValueError as e:
+            errors[path] = str(e)
+        except TimeoutError:
+            errors[path] = timed_out
+        except Exception:
+            _logger.exception("Submit validator of %r failed", path)
+            errors[path] = "Validation failed"
+    for future in not_done:
+        future.cancel()  # only stops validators still waiting for a worker
+        errors[futures[future]] = timed_out
+    return errors
@@ -0,0 +1,90 @@
+__all__ = [
+    "enable_validation_cache",
+    "validate",
+]
+import copy
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class _ValidationCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, BaseModel | ValidationError] = OrderedDict()
+        self.lock = Lock()
+
+
+_CACHES: WeakKeyDictionary[type[BaseModel], _ValidationCache] = WeakKeyDictionary()
+
+
+def enable_validation_cache(model: type[BaseModel], maxsize: int = 256) -> None:
+    """Cache the values validated by forms of `model`, shared by all sessions.
+
+    The last `maxsize` distinct raw inputs are mapped to their validated value, or to their `ValidationError`,
+    so that rerunning a form whose inputs match one of them skips validation. Nested models have caches
+    of their own, enabled separately. Cached values are returned as shallow copies unless the model is frozen,
+    so their nested values must be treated as read-only.
+
+    Enabling it again only changes `maxsize`.
+
+    Example:
+    -------
+    ```python
+    enable_validation_cache(MyModel, maxsize=1024)
+    ```
+
+    """
+    if (cache := _CACHES.get(model)) is None:
+        _CACHES[model] = _ValidationCache(maxsize)
+    else:  # e.g. enabled again on a rerun, keeping the cached values
+        cache.maxsize = maxsize
+
+
+def _freeze(value: Any) -> Hashable:
+    # Types are part of the key, since e.g. `1 == 1.0 == True` but they validate differently
+    if isinstance(value, BaseModel):
+        return type(value), _freeze(value.__dict__)
+    if isinstance(value, dict):
+        return dict, tuple((name, _freeze(item)) for name, item in value.items())
+    if isinstance(value, list | tuple | set | frozenset):
+        return type(value), tuple(map(_freeze, value))
+    return type(value), value
+
+
+def validate(model: type[T], raw_input_values: dict[str, Any]) -> tuple[T, bool]:
+    """Validate raw input values, using the model's validation cache if enabled.
+
+    Return the value and whether it was found in the cache.
+    """
+    if (cache := _CACHES.get(model)) is None:
+        return model(**raw_input_values), False
+    key = _freeze(raw_input_values)
+    try:
+        hash(key)
+    except TypeError:  # e.g. a data frame, validated every time
+        return model(**raw_input_values), False
+
+    with cache.lock:
+        if (cached := cache.entries.get(key)) is not None:
+            cache.entries.move_to_end(key)
+    hit = cached is not None
+    if cached is None:
+        try:
+            cached = model(**raw_input_values)
+        except ValidationError as e:
+            cached = e.with_traceback(None)
+        with cache.lock:
+            cache.entries[key] = cached
+            while len(cache.entries) > cache.maxsize:
+                cache.entries.popitem(last=False)
+    if isinstance(cached, ValidationError):
+        # Each raise gets a copy, with a traceback of its own
+        raise copy.copy(cached)
+    return (cached if model.model_config.get("frozen") else cached.model_copy()), hit  # ty: ignore[invalid-return-type]
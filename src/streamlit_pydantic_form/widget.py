@@ -1,25 +1,46 @@
 __all__ = [
     "Checkbox",
     "Slider",
+    "SpooledFileUploader",
+    "Table",
     "WidgetBuilder",
 ]
 from abc import ABC, abstractmethod
-from datetime import datetime, time
-from typing import Any, Generic, Literal, TypeVar
-from uuid import uuid4
+from collections.abc import Callable, Collection
+from datetime import date, datetime, time
+from enum import Enum
+from functools import partial
+from hashlib import blake2b
+from inspect import isclass
+from types import NoneType, UnionType
+from typing import Any, Generic, Literal, TypeVar, Union, get_args, get_origin
 
 import streamlit as st
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
 from streamlit.delta_generator import DeltaGenerator
+from streamlit.elements.lib.form_utils import current_form_id
 from streamlit.elements.widgets.time_widgets import DateValue, DateWidgetReturn
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
+from ._exceptions import WidgetKeyCollisionError
+from ._files import SpooledUpload, spool_upload
+from ._options import OptionProvider
+
 _T = TypeVar("_T")
 
 _NOT_SET = object()
 
+# Attribute of the session's script run context holding the keys derived in its current run
+_DERIVED_KEYS_ATTR = "_streamlit_pydantic_form_derived_keys"
+
 
 class WidgetBuilder(ABC, Generic[_T]):
     default = _NOT_SET
+    # Whether the widget's value can be set through session state, e.g. to restore a draft
+    value_assignable = True
 
     @abstractmethod
     def build(
@@ -31,14 +52,141 @@ class WidgetBuilder(ABC, Generic[_T]):
         kwargs: dict[str, Any] | None = None,
     ) -> _T: ...
 
+    def to_widget_value(self, value: Any) -> Any:
+        """Convert a field value into the `value` accepted by `build`."""
+        return value
+
+    def initial_widget_value(self) -> Any:
+        """Return the value returned by the widget when first built without a value.
+
+        It gives the fields of list items that have never been displayed the value a render would give them.
+        It is `PydanticUndefined` if unknown, leaving the field to its model default.
+        """
+        return PydanticUndefined
+
+    def bind(self, annotation: Any) -> "WidgetBuilder[_T]":  # noqa: ARG002
+        """Return the builder to use for a field annotated with `annotation`.
+
+        It is called once per field when the form plan is compiled.
+        """
+        return self
+
 
 # Widget builders for Streamlit input widgets
 # Note "st.button and st.download_button cannot be added to a form."
 # Ref: https://docs.streamlit.io/library/api-reference/control-flow/st.form
 
 
-def _generate_random_key() -> str:
-    return str(uuid4())
+# Arguments that hold the widget's initial value rather than its configuration
+_VALUE_KWARGS = frozenset({"value", "index", "default"})
+
+
+def _config_token(value: Any) -> str:
+    """Return a representation of a widget argument that is stable across reruns and processes."""
+    if isinstance(value, list | tuple):
+        return f"[{','.join(map(_config_token, value))}]"
+    if isinstance(value, dict):
+        return f"{{{','.join(f'{k!r}:{_config_token(v)}' for k, v in sorted(value.items(), key=repr))}}}"
+    if isclass(value) or callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__qualname__)}"
+    token = repr(value)
+    # Default reprs contain the object's address, which changes on every rerun
+    return f"{type(value).__module__}.{type(value).__qualname__}" if " at 0x" in token else token
+
+
+def _derive_key(builder: "WidgetBuilder[Any]", kwargs: dict[str, Any], form: DeltaGenerator | None) -> str:
+    """Derive the key of a widget built with `randomize_key=True`.
+
+    The key is derived from the `st.form` the widget is in, if any, the builder's configuration and the `key`
+    given by the caller, if any, which can tell apart builders with the same configuration in the same form.
+    It is the same on every rerun, so Streamlit keeps the widget's state and only sends the changes.
+    """
+    args = getattr(builder, "_args", ())
+    form_id = current_form_id(st._main if form is None else form)  # noqa: SLF001
+    config = _config_token(
+        [type(builder), form_id, args, {k: v for k, v in kwargs.items() if k not in _VALUE_KWARGS}],
+    )
+    key = f"streamlit_pydantic_form:{type(builder).__name__}:{blake2b(config.encode(), digest_size=8).hexdigest()}"
+    # Detect two builders given the same key in a run, which would otherwise share the widget state
+    keys = _derived_keys_this_run()
+    if key in keys:
+        raise WidgetKeyCollisionError(key, type(builder).__name__)
+    keys.add(key)
+    return key
+
+
+def _derived_keys_this_run() -> set[str]:
+    """Return the keys derived so far in the current script run of the session."""
+    ctx = get_script_run_ctx()
+    if ctx is None:  # outside of a script run, e.g. in bare mode
+        return set()
+    # Streamlit replaces the run's cursors on every (fragment) rerun, which tells the runs apart
+    run, keys = getattr(ctx, _DERIVED_KEYS_ATTR, (None, set()))
+    if run is not ctx.cursors:
+        keys = set()
+        setattr(ctx, _DERIVED_KEYS_ATTR, (ctx.cursors, keys))
+    return keys
+
+
+def _arg(args: tuple[Any, ...], kwargs: dict[str, Any], name: str, position: int, default: Any = None) -> Any:
+    return kwargs[name] if name in kwargs else args[position] if len(args) > position else default
+
+
+def _options_arg(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+    return _arg(args, kwargs, "options", 1, ())
+
+
+def _initial_option(args: tuple[Any, ...], kwargs: dict[str, Any], index: Any) -> Any:
+    if isinstance(options := _options_arg(args, kwargs), OptionProvider):
+        options = options.search()
+    options = list(options)
+    return options[index] if index is not None and index < len(options) else None
+
+
+def _option_index(args: tuple[Any, ...], kwargs: dict[str, Any], value: Any) -> Any:
+    """Return the index of `value` in the widget's options, or `value` itself if it is not an option.
+
+    Options given by an `OptionProvider` change with the search text, so their values are kept as is.
+    """
+    if isinstance(options := _options_arg(args, kwargs), OptionProvider):
+        return value
+    options = list(options)
+    if isinstance(value, Enum) and value not in options:
+        value = value.value
+    try:
+        return options.index(value)
+    except ValueError:
+        return value
+
+
+def _provide_options(
+    provider: OptionProvider,
+    form: DeltaGenerator | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    value: Any,
+) -> tuple[tuple[Any, ...], dict[str, Any], list[Any]]:
+    """Replace the option provider in the widget's arguments by the options matching the search text.
+
+    The selected options, from the widget's state or else `value`, stay among the options.
+    Returns the arguments and the selected options.
+    """
+    key = kwargs.get("key")
+    if key is not None and key in st.session_state:
+        value = st.session_state[key]
+    selected = [] if value is None else list(value) if isinstance(value, list) else [value]
+
+    prefix = ""
+    if key is not None:
+        label = args[0] if args else kwargs.get("label", "")
+        search = st.text_input if form is None else form.text_input
+        prefix = search(f"Search {label}", key=f"{key}:__search", placeholder="Type to search") or ""
+    options = provider.search(prefix)
+    options = options + [option for option in selected if option not in options]
+
+    if "options" in kwargs:
+        return args, kwargs | {"options": options}, selected
+    return (args[0], options, *args[2:]), kwargs, selected
 
 
 class Checkbox(WidgetBuilder[bool]):
@@ -47,6 +195,9 @@ class Checkbox(WidgetBuilder[bool]):
         self._kwargs = kwargs
         self.default: bool = False
 
+    def initial_widget_value(self) -> Any:
+        return self.default
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -59,7 +210,7 @@ class Checkbox(WidgetBuilder[bool]):
         value = value if value is not None else self.default  # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.checkbox(*self._args, **kwargs) if form is None else form.checkbox(*self._args, **kwargs)
 
 
@@ -69,6 +220,9 @@ class Toggle(WidgetBuilder[bool]):
         self._kwargs = kwargs
         self.default: bool = False
 
+    def initial_widget_value(self) -> Any:
+        return self.default
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -81,7 +235,7 @@ class Toggle(WidgetBuilder[bool]):
         value = value if value is not None else self.default  # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.toggle(*self._args, **kwargs) if form is None else form.toggle(*self._args, **kwargs)
 
 
@@ -91,6 +245,12 @@ class Radio(WidgetBuilder[Any | None]):
         self._kwargs = kwargs
         self.default: int | None = 0
 
+    def to_widget_value(self, value: Any) -> Any:
+        return _option_index(self._args, self._kwargs, value)
+
+    def initial_widget_value(self) -> Any:
+        return _initial_option(self._args, self._kwargs, self.default)
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -100,11 +260,15 @@ class Radio(WidgetBuilder[Any | None]):
         kwargs: dict[str, Any] | None = None,
     ) -> Any | None:
         kwargs = self._kwargs | kwargs if kwargs is not None else self._kwargs
+        if randomize_key:
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
+        args = self._args
+        if isinstance(provider := _options_arg(args, kwargs), OptionProvider):
+            args, kwargs, selected = _provide_options(provider, form, args, kwargs, value)
+            value = _options_arg(args, kwargs).index(selected[0]) if selected else None
         value = value if value is not None else self.default
         kwargs = kwargs | {"index": value}
-        if randomize_key:
-            kwargs["key"] = _generate_random_key()
-        return st.radio(*self._args, **kwargs) if form is None else form.radio(*self._args, **kwargs)
+        return st.radio(*args, **kwargs) if form is None else form.radio(*args, **kwargs)
 
 
 class Selectbox(WidgetBuilder[Any | None]):
@@ -113,6 +277,12 @@ class Selectbox(WidgetBuilder[Any | None]):
         self._kwargs = kwargs
         self.default: int | None = 0
 
+    def to_widget_value(self, value: Any) -> Any:
+        return _option_index(self._args, self._kwargs, value)
+
+    def initial_widget_value(self) -> Any:
+        return _initial_option(self._args, self._kwargs, self.default)
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -122,11 +292,15 @@ class Selectbox(WidgetBuilder[Any | None]):
         kwargs: dict[str, Any] | None = None,
     ) -> Any | None:
         kwargs = self._kwargs | kwargs if kwargs is not None else self._kwargs
+        if randomize_key:
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
+        args = self._args
+        if isinstance(provider := _options_arg(args, kwargs), OptionProvider):
+            args, kwargs, selected = _provide_options(provider, form, args, kwargs, value)
+            value = _options_arg(args, kwargs).index(selected[0]) if selected else None
         value = value if value is not None else self.default
         kwargs = kwargs | {"index": value}
-        if randomize_key:
-            kwargs["key"] = _generate_random_key()
-        return st.selectbox(*self._args, **kwargs) if form is None else form.selectbox(*self._args, **kwargs)
+        return st.selectbox(*args, **kwargs) if form is None else form.selectbox(*args, **kwargs)
 
 
 class Multiselect(WidgetBuilder[list[Any]]):
@@ -135,6 +309,9 @@ class Multiselect(WidgetBuilder[list[Any]]):
         self._kwargs = kwargs
         self.default: Any | None = None
 
+    def initial_widget_value(self) -> Any:
+        return list(self.default or ())  # ty: ignore[invalid-argument-type]
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -144,11 +321,14 @@ class Multiselect(WidgetBuilder[list[Any]]):
         kwargs: dict[str, Any] | None = None,
     ) -> list[Any]:
         kwargs = self._kwargs | kwargs if kwargs is not None else self._kwargs
+        if randomize_key:
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
+        args = self._args
+        if isinstance(provider := _options_arg(args, kwargs), OptionProvider):
+            args, kwargs, value = _provide_options(provider, form, args, kwargs, value)
         value = value if value is not None else self.default  # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"default": value}
-        if randomize_key:
-            kwargs["key"] = _generate_random_key()
-        return st.multiselect(*self._args, **kwargs) if form is None else form.multiselect(*self._args, **kwargs)
+        return st.multiselect(*args, **kwargs) if form is None else form.multiselect(*args, **kwargs)
 
 
 class Slider(WidgetBuilder[Any]):
@@ -157,6 +337,9 @@ class Slider(WidgetBuilder[Any]):
         self._kwargs = kwargs
         self.default: Any | None = None
 
+    def initial_widget_value(self) -> Any:
+        return self.default if self.default is not None else _arg(self._args, self._kwargs, "min_value", 1, 0)
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -169,7 +352,7 @@ class Slider(WidgetBuilder[Any]):
         value = value if value is not None else self.default
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.slider(*self._args, **kwargs) if form is None else form.slider(*self._args, **kwargs)
 
 
@@ -179,6 +362,12 @@ class SelectSlider(WidgetBuilder[Any | tuple[Any]]):
         self._kwargs = kwargs
         self.default = None
 
+    def initial_widget_value(self) -> Any:
+        if self.default is not None:
+            return self.default
+        options = list(_options_arg(self._args, self._kwargs))
+        return options[0] if options else PydanticUndefined
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -191,7 +380,7 @@ class SelectSlider(WidgetBuilder[Any | tuple[Any]]):
         value = value if value is not None else self.default
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.select_slider(*self._args, **kwargs) if form is None else form.select_slider(*self._args, **kwargs)
 
 
@@ -201,6 +390,9 @@ class TextInput(WidgetBuilder[str | None]):
         self._kwargs = kwargs
         self.default: str = ""
 
+    def initial_widget_value(self) -> Any:
+        return self.default
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -213,7 +405,7 @@ class TextInput(WidgetBuilder[str | None]):
         value = value if value is not None else self.default  # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.text_input(*self._args, **kwargs) if form is None else form.text_input(*self._args, **kwargs)  # type: ignore[no-any-return]
 
 
@@ -223,6 +415,13 @@ class NumberInput(WidgetBuilder[int | float | None]):
         self._kwargs = kwargs
         self.default: int | float | Literal["min"] = "min"
 
+    def initial_widget_value(self) -> Any:
+        if self.default != "min":
+            return self.default
+        if (min_value := _arg(self._args, self._kwargs, "min_value", 1)) is not None:
+            return min_value
+        return 0.0 if isinstance(_arg(self._args, self._kwargs, "step", 4), float) else 0
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -235,7 +434,7 @@ class NumberInput(WidgetBuilder[int | float | None]):
         value = value if value is not None else self.default  # type: ignore[assignment] # TODO: Fix this # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.number_input(*self._args, **kwargs) if form is None else form.number_input(*self._args, **kwargs)  # type: ignore[no-any-return]
 
 
@@ -245,6 +444,9 @@ class TextArea(WidgetBuilder[str | None]):
         self._kwargs = kwargs
         self.default: str = ""
 
+    def initial_widget_value(self) -> Any:
+        return self.default
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -257,7 +459,7 @@ class TextArea(WidgetBuilder[str | None]):
         value = value if value is not None else self.default  # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.text_area(*self._args, **kwargs) if form is None else form.text_area(*self._args, **kwargs)  # type: ignore[no-any-return]
 
 
@@ -267,6 +469,9 @@ class DateInput(WidgetBuilder[DateWidgetReturn]):
         self._kwargs = kwargs
         self.default: DateValue | Literal["today"] = "today"
 
+    def initial_widget_value(self) -> Any:
+        return date.today() if self.default == "today" else self.default  # noqa: DTZ011
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -279,7 +484,7 @@ class DateInput(WidgetBuilder[DateWidgetReturn]):
         value = value if value is not None else self.default  # type: ignore[assignment] # TODO: Fix this # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.date_input(*self._args, **kwargs) if form is None else form.date_input(*self._args, **kwargs)  # type: ignore[no-any-return]
 
 
@@ -289,6 +494,9 @@ class TimeInput(WidgetBuilder[time | None]):
         self._kwargs = kwargs
         self.default: time | datetime | Literal["now"] = "now"
 
+    def initial_widget_value(self) -> Any:
+        return datetime.now().time().replace(second=0, microsecond=0) if self.default == "now" else self.default  # noqa: DTZ005
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -301,15 +509,20 @@ class TimeInput(WidgetBuilder[time | None]):
         value = value if value is not None else self.default  # type: ignore[assignment] # TODO: Fix this # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.time_input(*self._args, **kwargs) if form is None else form.time_input(*self._args, **kwargs)  # type: ignore[no-any-return]
 
 
 class FileUploader(WidgetBuilder[Any]):
+    value_assignable = False
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._args = args
         self._kwargs = kwargs
 
+    def initial_widget_value(self) -> Any:
+        return [] if self._kwargs.get("accept_multiple_files") else None
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -320,15 +533,104 @@ class FileUploader(WidgetBuilder[Any]):
     ) -> Any:
         kwargs = self._kwargs | kwargs if kwargs is not None else self._kwargs
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.file_uploader(*self._args, **kwargs) if form is None else form.file_uploader(*self._args, **kwargs)
 
 
+class SpooledFileUploader(WidgetBuilder[Any]):
+    """File uploader giving the model `SpooledUpload` handles instead of `UploadedFile` objects.
+
+    Each uploaded file is copied once, in chunks of `chunk_size` bytes, to a temporary file while its SHA-256
+    hash is computed, so the model never holds the file's bytes. Files larger than `max_size` bytes or whose
+    content type is not in `content_types` are rejected with an error message.
+
+    Example:
+    -------
+    ```python
+    class FormModel(BaseModel):
+        dataset: Annotated[SpooledUpload, widget.SpooledFileUploader("Dataset", max_size=2**30)]
+    ```
+
+    """
+
+    value_assignable = False
+
+    def __init__(
+        self,
+        *args: Any,
+        max_size: int | None = None,
+        content_types: Collection[str] | None = None,
+        chunk_size: int = 1 << 20,
+        **kwargs: Any,
+    ) -> None:
+        self._args = args
+        self._kwargs = kwargs
+        self.max_size = max_size
+        self.content_types = content_types
+        self.chunk_size = chunk_size
+
+    def initial_widget_value(self) -> Any:
+        return [] if self._kwargs.get("accept_multiple_files") else None
+
+    def build(
+        self,
+        form: DeltaGenerator | None = None,
+        *,
+        randomize_key: bool = False,
+        value: Any | None = None,  # noqa: ARG002
+        kwargs: dict[str, Any] | None = None,
+    ) -> Any:
+        kwargs = self._kwargs | kwargs if kwargs is not None else self._kwargs
+        if randomize_key:
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
+        # The uploader keeps its own state under a separate key, so that the handles can be stored
+        # under the field's key and each file is spooled only once
+        key = kwargs.get("key")
+        if key is not None:
+            kwargs = kwargs | {"key": f"{key}:__uploader"}
+
+        uploaded = (
+            st.file_uploader(*self._args, **kwargs) if form is None else form.file_uploader(*self._args, **kwargs)
+        )
+        files = [] if uploaded is None else uploaded if isinstance(uploaded, list) else [uploaded]
+        previous = st.session_state.get(key) if key is not None else None
+        spooled = {
+            handle.file_id: handle
+            for handle in (previous if isinstance(previous, list) else [previous])
+            if isinstance(handle, SpooledUpload)
+        }
+        try:
+            handles = [
+                spooled.get(file.file_id)
+                or spool_upload(
+                    file,
+                    chunk_size=self.chunk_size,
+                    max_size=self.max_size,
+                    content_types=self.content_types,
+                )
+                for file in files
+            ]
+        except ValueError as e:
+            # The field is left empty, so that a required field fails validation with the error shown
+            (st if form is None else form).error(str(e))
+            handles = []
+
+        result = handles if isinstance(uploaded, list) else handles[0] if handles else None
+        if key is not None:
+            st.session_state[key] = result
+        return result
+
+
 class CameraInput(WidgetBuilder[UploadedFile | None]):
+    value_assignable = False
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._args = args
         self._kwargs = kwargs
 
+    def initial_widget_value(self) -> Any:
+        return None
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -339,7 +641,7 @@ class CameraInput(WidgetBuilder[UploadedFile | None]):
     ) -> UploadedFile | None:
         kwargs = self._kwargs | kwargs if kwargs is not None else self._kwargs
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.camera_input(*self._args, **kwargs) if form is None else form.camera_input(*self._args, **kwargs)
 
 
@@ -349,6 +651,9 @@ class ColorPicker(WidgetBuilder[str]):
         self._kwargs = kwargs
         self.default: str | None = None
 
+    def initial_widget_value(self) -> Any:
+        return self.default if self.default is not None else "#000000"
+
     def build(
         self,
         form: DeltaGenerator | None = None,
@@ -361,5 +666,142 @@ class ColorPicker(WidgetBuilder[str]):
         value = value if value is not None else self.default  # ty: ignore[invalid-assignment]
         kwargs = kwargs | {"value": value}
         if randomize_key:
-            kwargs["key"] = _generate_random_key()
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
         return st.color_picker(*self._args, **kwargs) if form is None else form.color_picker(*self._args, **kwargs)
+
+
+# Column types of the table widget, checked in order (e.g. `bool` before `int`, `datetime` before `date`)
+_TABLE_COLUMNS: list[tuple[type, Callable[..., Any]]] = [
+    (bool, st.column_config.CheckboxColumn),
+    (int, partial(st.column_config.NumberColumn, step=1)),
+    (float, st.column_config.NumberColumn),
+    (datetime, st.column_config.DatetimeColumn),
+    (date, st.column_config.DateColumn),
+    (time, st.column_config.TimeColumn),
+    (str, st.column_config.TextColumn),
+]
+
+
+def _non_optional(annotation: Any) -> Any:
+    """Return `X` if `annotation` is `X | None`, else `annotation` itself."""
+    args = get_args(annotation)
+    if get_origin(annotation) in (Union, UnionType) and len(args) == 2 and NoneType in args:
+        return next(arg for arg in args if arg is not NoneType)
+    return annotation
+
+
+def _table_column(name: str, field: FieldInfo) -> Any:
+    annotation = _non_optional(field.annotation)
+    kwargs: dict[str, Any] = {
+        "label": field.title or name,
+        "help": field.description,
+        "required": field.is_required(),
+    }
+    if field.default is not PydanticUndefined and field.default is not None:
+        kwargs["default"] = field.default.value if isinstance(field.default, Enum) else field.default
+    if get_origin(annotation) is Literal:
+        return st.column_config.SelectboxColumn(options=list(get_args(annotation)), **kwargs)
+    if isclass(annotation) and issubclass(annotation, Enum):
+        return st.column_config.SelectboxColumn(options=[member.value for member in annotation], **kwargs)
+    for column_type, column in _TABLE_COLUMNS:
+        if isclass(annotation) and issubclass(annotation, column_type):
+            return column(**kwargs)
+    msg = f"Field `{name}` of type `{annotation}` cannot be edited in a table"
+    raise TypeError(msg)
+
+
+def _table_row(row: Any) -> dict[str, Any]:
+    # Enum columns offer the members' values, so the cells hold values rather than members
+    record = row.model_dump() if isinstance(row, BaseModel) else dict(row)
+    return {name: cell.value if isinstance(cell, Enum) else cell for name, cell in record.items()}
+
+
+class Table(WidgetBuilder[list[Any]]):
+    """Edit a `list[Model]` field of a flat item model as a single `st.data_editor` table.
+
+    The columns are derived from the item model's fields, and all the rows are validated
+    in a single `TypeAdapter(list[Model])` pass. Validation errors are reported by row and column,
+    and the last valid rows are returned until they are fixed; forms cannot be submitted meanwhile.
+
+    Example:
+    -------
+    ```python
+    class FormModel(BaseModel):
+        points: Annotated[list[PointModel], widget.Table(num_rows="dynamic")]
+    ```
+
+    """
+
+    value_assignable = False
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._kwargs: dict[str, Any] = {"num_rows": "dynamic", "hide_index": True} | kwargs
+        self.default: list[Any] = []
+        self._adapter: TypeAdapter[list[Any]] | None = None
+        self._column_config: dict[str, Any] = {}
+
+    def bind(self, annotation: Any) -> "Table":
+        item_model = get_args(annotation)[0] if get_origin(annotation) is list else None
+        if not (isclass(item_model) and issubclass(item_model, BaseModel)):
+            msg = f"Table widgets require a `list[Model]` field, got `{annotation}`"
+            raise TypeError(msg)
+        bound = Table(**self._kwargs)
+        bound._adapter = TypeAdapter(list[item_model])
+        bound._column_config = {name: _table_column(name, field) for name, field in item_model.model_fields.items()}
+        return bound
+
+    def initial_widget_value(self) -> Any:
+        return list(self.default)  # ty: ignore[invalid-argument-type]
+
+    def build(
+        self,
+        form: DeltaGenerator | None = None,
+        *,
+        randomize_key: bool = False,
+        value: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+    ) -> list[Any]:
+        if self._adapter is None:
+            msg = "Table widgets must be used as `Annotated` metadata of a `list[Model]` field"
+            raise TypeError(msg)
+        kwargs = self._kwargs | kwargs if kwargs is not None else self._kwargs
+        if randomize_key:
+            kwargs = kwargs | {"key": _derive_key(self, kwargs, form)}
+        # The editor keeps its own state (the edits) under a separate key,
+        # so that the validated rows can be stored under the field's key
+        key = kwargs.get("key")
+        if key is not None:
+            kwargs = kwargs | {"key": f"{key}:__editor"}
+
+        # pandas, and pyarrow which it loads, are imported by the first table rather than with the package
+        import pandas as pd  # noqa: PLC0415
+
+        rows: list[Any] = value if value is not None else self.default  # ty: ignore[invalid-assignment]
+        data = pd.DataFrame(
+            [_table_row(row) for row in rows],
+            columns=list(self._column_config),
+        )
+        kwargs = kwargs | {"column_config": self._column_config}
+        edited = st.data_editor(data, **kwargs) if form is None else form.data_editor(data, **kwargs)
+        records = edited.astype(object).where(edited.notna(), None).to_dict("records")
+
+        try:
+            items = self._adapter.validate_python(records)
+        except ValidationError as e:
+            messages = [
+                f"Row {error['loc'][0] + 1}, column `{error['loc'][1]}`: {error['msg']}"  # ty: ignore[unsupported-operator]
+                if len(error["loc"]) >= 2
+                else f"Row {error['loc'][0] + 1}: {error['msg']}"  # ty: ignore[unsupported-operator]
+                for error in e.errors()
+            ]
+            (st if form is None else form).error("\n\n".join(messages))
+            # The last valid rows are kept while the user is still editing the invalid ones
+            if key is None:
+                return rows
+            st.session_state[f"{key}:__errors"] = messages
+            return st.session_state.get(key, rows)
+
+        if key is not None:
+            st.session_state[key] = items
+            st.session_state.pop(f"{key}:__errors", None)
+        return items
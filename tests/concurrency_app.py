@@ -0,0 +1,10 @@
+import streamlit as st
+from shared_models import Profile
+
+from streamlit_pydantic_form import DynamicForm
+
+# The models, and the widget builders in their metadata, are shared by every session of the process
+form = DynamicForm("profile", model=Profile, initial_value=Profile.model_validate(st.session_state["prefill"]))
+form.input_widgets()
+if form.submitted:
+    st.write(form.value.model_dump_json())
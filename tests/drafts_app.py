@@ -0,0 +1,24 @@
+from typing import Annotated, Any
+
+import streamlit as st
+from pydantic import BaseModel
+
+from streamlit_pydantic_form import DraftStore, DynamicForm, SpooledUpload, widget
+
+
+class Report(BaseModel):
+    title: Annotated[str, widget.TextInput("Title")]
+    attachment: Annotated[SpooledUpload | None, widget.SpooledFileUploader("Attachment")] = None
+    document: Annotated[Any, widget.FileUploader("Document")] = None
+    photo: Annotated[Any, widget.CameraInput("Photo")] = None
+
+
+@st.cache_resource
+def draft_store(path: str) -> DraftStore:
+    return DraftStore(path)
+
+
+store = draft_store(st.session_state["draft_path"])
+form = DynamicForm("report", model=Report, draft_store=store, draft_id="user")
+form.input_widgets()
+store.flush()
@@ -0,0 +1,15 @@
+import streamlit as st
+from pydantic import BaseModel
+
+from streamlit_pydantic_form import DynamicForm
+
+
+class Article(BaseModel):
+    title: str
+    tags: list[str] = ["news"]
+
+
+form = DynamicForm.from_json_schema("article", Article.model_json_schema())
+form.input_widgets()
+if form.submitted:
+    st.write(form.value.model_dump_json())
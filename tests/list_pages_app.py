@@ -0,0 +1,21 @@
+from typing import Annotated
+
+import streamlit as st
+from pydantic import BaseModel
+
+from streamlit_pydantic_form import DynamicForm, widget
+
+
+class Item(BaseModel):
+    name: Annotated[str, widget.TextInput("Name")]
+    quantity: Annotated[int, widget.NumberInput("Quantity", min_value=1)]
+
+
+class Order(BaseModel):
+    items: list[Item]
+
+
+form = DynamicForm("order", model=Order, list_page_size=5)
+form.input_widgets()
+if form.submitted:
+    st.write(form.value.model_dump_json())
@@ -0,0 +1,30 @@
+import json
+import warnings
+from enum import Enum
+from typing import Annotated
+
+import streamlit as st
+from pydantic import BaseModel
+
+from streamlit_pydantic_form import StaticForm, widget
+
+
+# Defined in the page script, so that every rerun defines new classes
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Paint(BaseModel):
+    name: Annotated[str, widget.TextInput("Name")] = "wall"
+    color: Color = Color.BLUE
+
+
+with StaticForm("paint", model=Paint) as form:
+    value = form.input_widgets()
+    form.form_submit_button("Submit")
+
+with warnings.catch_warnings():
+    warnings.simplefilter("error")
+    dumped = value.model_dump_json()
+st.write(json.dumps({"is_color": isinstance(value.color, Color), "is_blue": value.color == Color.BLUE, "dump": dumped}))
@@ -0,0 +1,15 @@
+from typing import Annotated
+
+from pydantic import BaseModel
+
+from streamlit_pydantic_form import widget
+
+
+class Address(BaseModel):
+    city: Annotated[str, widget.TextInput("City")]
+
+
+class Profile(BaseModel):
+    name: Annotated[str, widget.TextInput("Name")]
+    age: Annotated[int, widget.NumberInput("Age", min_value=0, max_value=1000)]
+    address: Address
@@ -0,0 +1,23 @@
+from typing import Annotated
+
+import streamlit as st
+from pydantic import BaseModel
+
+from streamlit_pydantic_form import DynamicForm, widget
+
+
+class Line(BaseModel):
+    product: str
+    quantity: int
+
+
+class Invoice(BaseModel):
+    lines: Annotated[list[Line], widget.Table()]
+
+
+# A row still being entered, with an empty required cell
+initial_value = Invoice.model_construct(lines=[Line.model_construct(product=None, quantity=1)])
+form = DynamicForm("invoice", model=Invoice, initial_value=initial_value)
+form.input_widgets()
+if form.submitted:
+    st.write(form.value.model_dump_json())
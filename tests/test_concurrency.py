@@ -0,0 +1,67 @@
+import json
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from threading import Barrier
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from streamlit.runtime import Runtime
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as app_test_module
+from streamlit.testing.v1.util import patch_config_options
+
+APP = str(Path(__file__).parent / "concurrency_app.py")
+KEY = "streamlit_pydantic_form:profile"
+N_SESSIONS = 32
+
+
+class _PerRunRuntime(Runtime):
+    """Receives the runtime that each `AppTest` run installs and removes, leaving the shared one in place."""
+
+
+@pytest.fixture
+def shared_runtime(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    # Each AppTest run installs a runtime and config options of its own and removes them when it ends,
+    # which breaks the runs of the other sessions. Like a server, the sessions share one runtime instead.
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    monkeypatch.setattr(Runtime, "_instance", runtime)
+    monkeypatch.setattr(app_test_module, "Runtime", _PerRunRuntime)
+    monkeypatch.setattr(app_test_module, "patch_config_options", lambda _: nullcontext())
+    with patch_config_options({"global.appTest": True}):
+        yield
+
+
+def _run_session(idx: int, barrier: Barrier) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    prefill = {"name": f"user-{idx}", "age": idx, "address": {"city": f"city-{idx}"}}
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state["prefill"] = prefill
+    # Start rendering every session at the same time
+    barrier.wait()
+    at.run()
+    rendered = {
+        "name": at.text_input(key=f"{KEY}.name").value,
+        "age": at.number_input(key=f"{KEY}.age").value,
+        "address": {"city": at.text_input(key=f"{KEY}.address.city").value},
+    }
+    next(button for button in at.button if button.label == "Submit").click().run()
+    submitted = json.loads(at.markdown[-1].value)
+    return prefill, rendered, submitted
+
+
+@pytest.mark.usefixtures("shared_runtime")
+def test_sessions_see_only_their_own_prefill() -> None:
+    barrier = Barrier(N_SESSIONS)
+    with ThreadPoolExecutor(N_SESSIONS) as executor:
+        results = list(executor.map(_run_session, range(N_SESSIONS), [barrier] * N_SESSIONS))
+
+    for prefill, rendered, submitted in results:
+        assert rendered == prefill
+        assert submitted == prefill
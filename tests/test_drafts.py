@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).parent / "drafts_app.py")
+KEY = "streamlit_pydantic_form:report"
+
+
+def _session(draft_path: Path) -> AppTest:
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.session_state["draft_path"] = str(draft_path)
+    return at.run()
+
+
+def test_draft_with_uploaders_is_restored_in_a_new_session(tmp_path: Path) -> None:
+    at = _session(tmp_path / "drafts.sqlite3")
+    at.text_input(key=f"{KEY}.title").input("Quarterly report").run()
+    assert not at.exception
+
+    at = _session(tmp_path / "drafts.sqlite3")
+    assert not at.exception
+    assert at.text_input(key=f"{KEY}.title").value == "Quarterly report"
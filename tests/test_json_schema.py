@@ -0,0 +1,32 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+from streamlit.testing.v1 import AppTest
+
+from streamlit_pydantic_form import model_from_json_schema
+
+APP = str(Path(__file__).parent / "json_schema_app.py")
+KEY = "streamlit_pydantic_form:article"
+
+
+def test_arrays_of_strings_are_edited_one_item_per_line() -> None:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    assert not at.exception
+    assert at.text_area(key=f"{KEY}.tags").value == "news"
+
+    at.text_input(key=f"{KEY}.title").input("Release")
+    at.text_area(key=f"{KEY}.tags").input("python\n\n streamlit ")
+    next(button for button in at.button if button.label == "Submit").click().run()
+    assert not at.exception
+    assert json.loads(at.markdown[0].value) == {"title": "Release", "tags": ["python", "streamlit"]}
+
+
+def test_arrays_without_a_widget_name_the_property() -> None:
+    class Calendar(BaseModel):
+        holidays: list[date]
+
+    with pytest.raises(ValueError, match="`holidays`"):
+        model_from_json_schema(Calendar.model_json_schema())
@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from streamlit.elements.lib import policies
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).parent / "list_pages_app.py")
+KEY = "streamlit_pydantic_form:order"
+
+
+def test_items_never_displayed_take_their_widgets_initial_values() -> None:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    at.number_input(key=f"{KEY}.items:__n_items_input").set_value(12).run()
+    assert not at.exception
+
+    next(button for button in at.button if button.label == "Submit").click().run()
+    items = json.loads(at.markdown[-1].value)["items"]
+    assert items == [{"name": "", "quantity": 1}] * 12
+
+
+def test_page_beyond_the_last_one_is_clamped_without_warning(monkeypatch: pytest.MonkeyPatch) -> None:
+    warnings: list[Any] = []
+    monkeypatch.setattr(policies, "_shown_default_value_warning", False)
+    monkeypatch.setattr(policies._LOGGER, "warning", lambda *args, **_: warnings.append(args))  # noqa: SLF001
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    at.number_input(key=f"{KEY}.items:__n_items_input").set_value(12).run()
+    at.number_input(key=f"{KEY}.items:__page").set_value(3).run()
+    at.number_input(key=f"{KEY}.items:__n_items_input").set_value(6).run()
+    assert not at.exception
+    assert not warnings
+    assert at.number_input(key=f"{KEY}.items:__page").value == 2
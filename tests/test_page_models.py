@@ -0,0 +1,18 @@
+import json
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).parent / "page_models_app.py")
+
+
+def test_values_use_the_classes_of_the_current_run() -> None:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    for _ in range(2):
+        at.run()
+        assert not at.exception
+        assert json.loads(at.markdown[-1].value) == {
+            "is_color": True,
+            "is_blue": True,
+            "dump": '{"name":"wall","color":"blue"}',
+        }
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from streamlit_pydantic_form import ParquetSink
+
+
+class Entry(BaseModel):
+    name: str
+    count: int
+
+
+def test_package_import_does_not_load_pyarrow() -> None:
+    code = "import sys, streamlit_pydantic_form; print('pyarrow' in sys.modules or 'pandas' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.strip() == "False"
+
+
+def test_parquet_sink_writes_submitted_values(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    sink = ParquetSink(tmp_path, flush_interval=0)
+    sink.submit(Entry(name="bolt", count=3))
+    sink.close()
+    (path,) = tmp_path.glob("*.parquet")
+    assert pq.read_table(path).to_pylist() == [{"name": "bolt", "count": 3}]
@@ -0,0 +1,32 @@
+import pytest
+from pydantic import BaseModel
+
+from streamlit_pydantic_form._submit import run_submit_validators
+
+
+class Item(BaseModel):
+    name: str
+
+
+class Order(BaseModel):
+    items: list[Item]
+
+
+def _reject_empty(name: str) -> None:
+    if not name:
+        msg = "A name is required"
+        raise ValueError(msg)
+
+
+def test_validators_at_list_item_paths() -> None:
+    order = Order(items=[Item(name="bolt"), Item(name="")])
+    validators = {f"items[{idx}].name": _reject_empty for idx in range(3)}
+
+    # The third item does not exist, so its validator is skipped
+    assert run_submit_validators(order, validators, timeout=5) == {"items[1].name": "A name is required"}
+
+
+@pytest.mark.parametrize("path", ["items.name", "items[0].title", "items[x]"])
+def test_paths_not_matching_the_model_are_rejected(path: str) -> None:
+    with pytest.raises(ValueError, match="is not a field path"):
+        run_submit_validators(Order(items=[Item(name="bolt")]), {path: _reject_empty}, timeout=5)
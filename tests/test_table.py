@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).parent / "table_app.py")
+
+
+def test_invalid_rows_are_reported_without_failing_the_page() -> None:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    assert not at.exception
+    assert [error.value for error in at.error] == ["Row 1, column `product`: Input should be a valid string"]
+
+
+def test_form_with_invalid_rows_is_not_submitted() -> None:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    next(button for button in at.button if button.label == "Submit").click().run()
+    assert not at.exception
+    assert "Correct the invalid rows before submitting" in [error.value for error in at.error]
+    assert not at.markdown
@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).parent / "widget_keys_app.py")
+
+
+def test_same_builder_in_two_forms_gets_stable_distinct_keys() -> None:
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    assert not at.exception
+    keys = [text_input.key for text_input in at.text_input]
+    assert len(set(keys)) == 2
+
+    at.run()
+    assert [text_input.key for text_input in at.text_input] == keys
+
+
+def test_same_builder_twice_in_a_form_is_a_collision() -> None:
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.session_state["duplicate"] = True
+    at.run()
+    assert len(at.exception) == 1
+    assert at.exception[0].message.startswith("Two `TextInput` widget builders")
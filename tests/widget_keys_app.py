@@ -0,0 +1,13 @@
+import streamlit as st
+
+from streamlit_pydantic_form import widget
+
+with st.form("billing"):
+    widget.TextInput("Name").build(randomize_key=True)
+    st.form_submit_button("Save billing")
+
+shipping = st.form("shipping")
+widget.TextInput("Name").build(shipping, randomize_key=True)
+if st.session_state.get("duplicate"):
+    widget.TextInput("Name").build(shipping, randomize_key=True)
+shipping.form_submit_button("Save shipping")